@@ -0,0 +1,32 @@
+"""index_facts_source_url
+
+Revision ID: 4e1b7c2d9a10
+Revises: ccb8392f3316
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e1b7c2d9a10'
+down_revision: Union[str, Sequence[str], None] = 'ccb8392f3316'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index facts.source_url for FactStore.get_facts_by_source."""
+    # Backfill rows whose provenance was a model object at insert time
+    op.execute(
+        "UPDATE facts SET source_url = provenance->>'source_id' "
+        "WHERE source_url IS NULL AND provenance ? 'source_id'"
+    )
+    op.create_index(op.f('ix_facts_source_url'), 'facts', ['source_url'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the facts.source_url index."""
+    op.drop_index(op.f('ix_facts_source_url'), table_name='facts')
@@ -0,0 +1,27 @@
+"""index_verifications_inv_status
+
+Revision ID: 9b3f5e8a2c41
+Revises: 4e1b7c2d9a10
+Create Date: 2026-10-17 10:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3f5e8a2c41'
+down_revision: Union[str, Sequence[str], None] = '4e1b7c2d9a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index verifications by (investigation_id, status)."""
+    op.create_index('ix_verifications_inv_status', 'verifications', ['investigation_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the (investigation_id, status) index."""
+    op.drop_index('ix_verifications_inv_status', table_name='verifications')
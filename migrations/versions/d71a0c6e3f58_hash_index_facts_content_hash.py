@@ -0,0 +1,29 @@
+"""hash_index_facts_content_hash
+
+Revision ID: d71a0c6e3f58
+Revises: 9b3f5e8a2c41
+Create Date: 2026-10-17 11:26:05.713349
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd71a0c6e3f58'
+down_revision: Union[str, Sequence[str], None] = '9b3f5e8a2c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild ix_facts_content_hash as a hash index (equality lookups only)."""
+    op.drop_index(op.f('ix_facts_content_hash'), table_name='facts')
+    op.create_index('ix_facts_content_hash', 'facts', ['content_hash'], unique=False, postgresql_using='hash')
+
+
+def downgrade() -> None:
+    """Restore the B-tree content_hash index."""
+    op.drop_index('ix_facts_content_hash', table_name='facts', postgresql_using='hash')
+    op.create_index(op.f('ix_facts_content_hash'), 'facts', ['content_hash'], unique=False)
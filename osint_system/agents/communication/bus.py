@@ -1,13 +1,30 @@
 """Message bus implementation using aiopubsub for agent broadcasting and discovery."""
 
 import asyncio
-from typing import Optional, Any, Callable, Dict, Set
+from typing import Optional, Any, Callable, Dict, FrozenSet, Iterable, Set, Tuple
 from datetime import datetime
 import uuid
 from aiopubsub import Hub, Subscriber, Key
 from loguru import logger
 
 
+def _to_key(routing_key: str) -> Key:
+    """
+    Split a dotted routing key into a hierarchical aiopubsub Key.
+
+    "crawler.complete" becomes Key("crawler", "complete"), so the hub routes
+    on individual tokens and "*" works as a per-token wildcard (a trailing
+    "*" also matches deeper keys), e.g. "discovery.*".
+
+    Args:
+        routing_key: Dotted key or pattern
+
+    Returns:
+        Key with one component per dot-separated token
+    """
+    return Key(*routing_key.split("."))
+
+
 class MessageBus:
     """
     Singleton message bus for agent communication using aiopubsub.
@@ -41,6 +58,9 @@ class MessageBus:
             self.hub = Hub()
             self._subscribers: Dict[str, Subscriber] = {}
             self._active_subscriptions: Dict[str, Set[Key]] = {}
+            # (exact keys, wildcard keys) rebuilt lazily after subscription changes
+            self._dispatch_keys: Optional[Tuple[FrozenSet[Key], Tuple[Key, ...]]] = None
+            self._pending_tasks: Set[asyncio.Task] = set()
             self.logger = logger.bind(component="MessageBus")
             self._initialized = True
             self._shutdown = False
@@ -58,6 +78,11 @@ class MessageBus:
             self.logger.warning(f"Cannot publish to {key} - bus is shutting down")
             return
 
+        # Fast exit: skip wrapping when no subscription matches the key
+        routing_key = _to_key(key)
+        if not self._has_subscribers(routing_key):
+            return
+
         try:
             # Add metadata to all messages
             wrapped_message = {
@@ -67,13 +92,65 @@ class MessageBus:
                 "payload": message
             }
 
-            self.hub.publish(Key(key), wrapped_message)
-            self.logger.debug(f"Published message to {key}", message_id=wrapped_message["id"])
+            self.hub.publish(routing_key, wrapped_message)
+            # Brace-style args so loguru only formats when DEBUG is emitted
+            self.logger.debug("Published message to {key}", key=key,
+                              message_id=wrapped_message["id"])
 
         except Exception as e:
             self.logger.error(f"Failed to publish to {key}: {e}")
             raise
 
+    def has_subscribers(self, key: str) -> bool:
+        """
+        Check whether a message published to a key would reach anyone.
+
+        Lets publishers skip building expensive payloads nobody will
+        receive.
+
+        Args:
+            key: Dotted routing key (e.g., "context.update")
+
+        Returns:
+            True if at least one subscription matches the key
+        """
+        return self._has_subscribers(_to_key(key))
+
+    def _has_subscribers(self, key: Key) -> bool:
+        """
+        Check whether any active subscription matches a routing key.
+
+        Exact keys are a set lookup; only wildcard keys are scanned. The
+        lookup structures are rebuilt on the first publish after a
+        subscribe or unsubscribe.
+
+        Args:
+            key: Routing key being published
+
+        Returns:
+            True if at least one subscriber would receive the message
+        """
+        if self._dispatch_keys is None:
+            all_keys = {k for keys in self._active_subscriptions.values() for k in keys}
+            self._dispatch_keys = (
+                frozenset(k for k in all_keys if not k.is_wildcard),
+                tuple(k for k in all_keys if k.is_wildcard),
+            )
+
+        exact, wildcards = self._dispatch_keys
+        return key in exact or any(key.is_subset_of(w) for w in wildcards)
+
+    async def drain(self) -> None:
+        """
+        Wait until every message published so far has been handled.
+
+        Awaits the outstanding subscriber callback tasks, including any
+        scheduled by callbacks that publish in turn. Returns immediately
+        when nothing is pending.
+        """
+        while self._pending_tasks:
+            await asyncio.gather(*list(self._pending_tasks), return_exceptions=True)
+
     async def broadcast_capability(self, agent_name: str, capabilities: list[str]) -> None:
         """
         Broadcast agent capabilities for discovery.
@@ -146,38 +223,105 @@ class MessageBus:
         if self._shutdown:
             raise RuntimeError("Cannot subscribe - bus is shutting down")
 
-        # Create or get subscriber
+        subscriber = self._get_or_create_subscriber(subscriber_name)
+        self._register_callback(subscriber, subscriber_name, pattern, callback)
+        self._dispatch_keys = None
+
+        self.logger.info(f"Subscriber {subscriber_name} subscribed to pattern: {pattern}")
+        return subscriber
+
+    def subscribe_batch(
+        self,
+        subscriber_name: str,
+        subscriptions: Iterable[Tuple[str, Callable[[Any], None]]],
+    ) -> Subscriber:
+        """
+        Subscribe one subscriber to several patterns at once.
+
+        Equivalent to calling subscribe_to_pattern per pair, but the
+        subscriber is looked up once and the publish-side lookup structures
+        are invalidated once for the whole batch.
+
+        Args:
+            subscriber_name: Unique name for this subscriber
+            subscriptions: (pattern, callback) pairs to register
+
+        Returns:
+            Subscriber instance for management
+        """
+        if self._shutdown:
+            raise RuntimeError("Cannot subscribe - bus is shutting down")
+
+        subscriber = self._get_or_create_subscriber(subscriber_name)
+        patterns = []
+        for pattern, callback in subscriptions:
+            self._register_callback(subscriber, subscriber_name, pattern, callback)
+            patterns.append(pattern)
+        self._dispatch_keys = None
+
+        self.logger.info(f"Subscriber {subscriber_name} subscribed to patterns: {patterns}")
+        return subscriber
+
+    def _get_or_create_subscriber(self, subscriber_name: str) -> Subscriber:
+        """
+        Return the named subscriber, creating and tracking it if needed.
+
+        Args:
+            subscriber_name: Unique name for the subscriber
+
+        Returns:
+            Subscriber instance registered with the hub
+        """
         if subscriber_name not in self._subscribers:
             subscriber = Subscriber(self.hub, subscriber_name)
             self._subscribers[subscriber_name] = subscriber
             self._active_subscriptions[subscriber_name] = set()
             self.logger.debug(f"Created subscriber: {subscriber_name}")
-        else:
-            subscriber = self._subscribers[subscriber_name]
+            return subscriber
 
-        # Subscribe to pattern
-        key = Key(pattern)
-        subscriber.subscribe(key)
-
-        # Track subscription
         if subscriber_name not in self._active_subscriptions:
             self._active_subscriptions[subscriber_name] = set()
-        self._active_subscriptions[subscriber_name].add(key)
+        return self._subscribers[subscriber_name]
 
-        # Register callback
-        async def message_handler(key_received, message):
-            """Handle incoming messages."""
-            try:
-                await callback(message)
-            except Exception as e:
-                self.logger.error(f"Subscriber {subscriber_name} callback error: {e}",
-                                exc_info=True)
+    def _register_callback(self, subscriber: Subscriber, subscriber_name: str,
+                           pattern: str, callback: Callable[[Any], None]) -> None:
+        """
+        Subscribe to a pattern and attach its dispatching listener.
 
-        # Add the async listener for this key
-        subscriber.add_async_listener(key, message_handler)
+        Callers are responsible for resetting the publish-side lookup
+        structures afterwards.
 
-        self.logger.info(f"Subscriber {subscriber_name} subscribed to pattern: {pattern}")
-        return subscriber
+        Args:
+            subscriber: Subscriber to register on
+            subscriber_name: Name used for tracking and error logs
+            pattern: Key pattern to match
+            callback: Async function to call when message received
+        """
+        key = _to_key(pattern)
+        subscriber.subscribe(key)
+        self._active_subscriptions[subscriber_name].add(key)
+
+        # Register callback; the lock keeps delivery to this callback in
+        # publish order while each message runs as its own tracked task
+        delivery_lock = asyncio.Lock()
+
+        async def message_handler(message):
+            """Handle incoming messages."""
+            async with delivery_lock:
+                try:
+                    await callback(message)
+                except Exception as e:
+                    self.logger.error(f"Subscriber {subscriber_name} callback error: {e}",
+                                    exc_info=True)
+
+        def dispatch(key_received, message):
+            """Schedule the handler and track it until it completes."""
+            task = asyncio.get_running_loop().create_task(message_handler(message))
+            self._pending_tasks.add(task)
+            task.add_done_callback(self._pending_tasks.discard)
+
+        # Add the listener for this key
+        subscriber.add_sync_listener(key, dispatch)
 
     def unsubscribe(self, subscriber_name: str, pattern: Optional[str] = None) -> None:
         """
@@ -195,11 +339,12 @@ class MessageBus:
 
         if pattern:
             # Unsubscribe from specific pattern
-            key = Key(pattern)
+            key = _to_key(pattern)
             subscriber.unsubscribe(key)
 
             if subscriber_name in self._active_subscriptions:
                 self._active_subscriptions[subscriber_name].discard(key)
+            self._dispatch_keys = None
 
             self.logger.info(f"Unsubscribed {subscriber_name} from {pattern}")
         else:
@@ -210,6 +355,7 @@ class MessageBus:
                 del self._active_subscriptions[subscriber_name]
 
             del self._subscribers[subscriber_name]
+            self._dispatch_keys = None
             self.logger.info(f"Unsubscribed {subscriber_name} from all patterns")
 
     def get_active_subscriptions(self) -> Dict[str, Set[str]]:
@@ -220,7 +366,7 @@ class MessageBus:
             Dictionary mapping subscriber names to their key patterns
         """
         return {
-            name: {str(key) for key in keys}
+            name: {".".join(key) for key in keys}
             for name, keys in self._active_subscriptions.items()
         }
 
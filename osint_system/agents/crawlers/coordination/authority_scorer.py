@@ -4,14 +4,65 @@ Implements domain-based authority scoring with metadata signal enhancement.
 Used by crawlers to prioritize high-credibility sources.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from urllib.parse import urlparse
+from functools import lru_cache
 import logging
 
 
 logger = logging.getLogger(__name__)
 
 
+# Key under which a trie node stores its category ("" is never a label)
+_LEAF = ""
+
+
+def _build_suffix_trie(rules: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Build a trie over reversed domain labels.
+
+    Args:
+        rules: Mapping of domain suffix (e.g. "reuters.com", "gov.*") to
+            category. "*" matches a two-letter country-code label.
+
+    Returns:
+        Nested dict trie keyed by label, with categories under _LEAF
+    """
+    root: Dict[str, Any] = {}
+    for suffix, category in rules.items():
+        node = root
+        for label in reversed(suffix.split(".")):
+            node = node.setdefault(label, {})
+        node[_LEAF] = category
+    return root
+
+
+def _longest_suffix_match(
+    node: Dict[str, Any], labels: List[str], depth: int = 0
+) -> Tuple[int, Optional[str]]:
+    """
+    Find the most specific category for reversed domain labels.
+
+    Args:
+        node: Current trie node
+        labels: Domain labels in reverse order (TLD first)
+        depth: Number of labels consumed so far
+
+    Returns:
+        (matched label count, category), or (-1, None) if nothing matched
+    """
+    best: Tuple[int, Optional[str]] = (depth, node[_LEAF]) if _LEAF in node else (-1, None)
+    if depth < len(labels):
+        label = labels[depth]
+        for key in (label, "*") if len(label) == 2 else (label,):
+            child = node.get(key)
+            if child is not None:
+                match = _longest_suffix_match(child, labels, depth + 1)
+                if match[0] > best[0]:
+                    best = match
+    return best
+
+
 class AuthorityScorer:
     """
     Calculates authority scores for URLs based on domain and metadata signals.
@@ -67,6 +118,45 @@ class AuthorityScorer:
         "facebook.com": 0.3,
     }
 
+    # Suffix patterns (leading dot) from AUTHORITY_DOMAINS for label lookup
+    _SUFFIX_SCORES: Dict[str, float] = {
+        pattern: score
+        for pattern, score in AUTHORITY_DOMAINS.items()
+        if pattern.startswith(".")
+    }
+
+    # Domain suffix -> category; "*" matches a country-code label (e.g.
+    # "gov.*" covers gov.uk and gov.au)
+    CATEGORY_SUFFIXES: Dict[str, str] = {
+        # Government and military
+        "gov": "official",
+        "gov.*": "official",
+        "mil": "official",
+        "mil.*": "official",
+        # Academic
+        "edu": "academic",
+        "edu.*": "academic",
+        "ac.*": "academic",
+        # News organizations
+        "reuters.com": "news",
+        "apnews.com": "news",
+        "bbc.com": "news",
+        "nytimes.com": "news",
+        "washingtonpost.com": "news",
+        "theguardian.com": "news",
+        "aljazeera.com": "news",
+        # Organizations
+        "org": "organization",
+        "org.*": "organization",
+        # Social media
+        "reddit.com": "social",
+        "twitter.com": "social",
+        "x.com": "social",
+        "facebook.com": "social",
+    }
+
+    _CATEGORY_TRIE: Dict[str, Any] = _build_suffix_trie(CATEGORY_SUFFIXES)
+
     # Source type weights for composite scoring
     SOURCE_TYPE_WEIGHTS: Dict[str, float] = {
         "official": 1.0,
@@ -85,6 +175,8 @@ class AuthorityScorer:
             default_score: Default score for unknown domains (0.0-1.0)
         """
         self.default_score = default_score
+        # Domain scores depend only on the host, so cache them per instance
+        self._score_domain = lru_cache(maxsize=4096)(self._lookup_domain_score)
         logger.info(f"AuthorityScorer initialized with default score {default_score}")
 
     def calculate_score(
@@ -124,6 +216,38 @@ class AuthorityScorer:
 
         return score
 
+    def calculate_scores(
+        self,
+        urls: List[str],
+        metadata: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[float]:
+        """
+        Calculate authority scores for a batch of URLs.
+
+        Equivalent to calling calculate_score per URL, but per-URL debug
+        logging is skipped.
+
+        Args:
+            urls: URLs to score
+            metadata: Optional per-URL metadata dicts, aligned with urls
+
+        Returns:
+            Authority scores in the same order as urls
+        """
+        scores: List[float] = []
+
+        for i, url in enumerate(urls):
+            domain_score = self._get_domain_score(url)
+
+            meta = metadata[i] if metadata else None
+            if meta:
+                scores.append(min(1.0, domain_score + self._calculate_signal_adjustment(meta)))
+            else:
+                scores.append(domain_score)
+
+        logger.debug(f"Authority scores calculated for {len(urls)} URLs")
+        return scores
+
     def _get_domain_score(self, url: str) -> float:
         """
         Get authority score based on domain.
@@ -136,26 +260,43 @@ class AuthorityScorer:
         """
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc.lower()
+            return self._score_domain(parsed.netloc.lower())
 
-            # Remove www. prefix for matching
-            if domain.startswith("www."):
-                domain = domain[4:]
+        except Exception as e:
+            logger.warning(f"Failed to parse URL for authority scoring: {e}")
+            return self.default_score
 
-            # Check exact domain match first
-            if domain in self.AUTHORITY_DOMAINS:
-                return self.AUTHORITY_DOMAINS[domain]
+    def _lookup_domain_score(self, domain: str) -> float:
+        """
+        Resolve the authority score for a lowercased network location.
 
-            # Check TLD matches (e.g., .gov, .edu)
-            for tld_pattern, score in self.AUTHORITY_DOMAINS.items():
-                if tld_pattern.startswith(".") and domain.endswith(tld_pattern):
-                    return score
+        Memoized per instance as _score_domain.
 
-            return self.default_score
+        Args:
+            domain: Lowercased netloc from the URL
 
-        except Exception as e:
-            logger.warning(f"Failed to parse URL for authority scoring: {e}")
-            return self.default_score
+        Returns:
+            Domain-based authority score
+        """
+        # Remove www. prefix for matching
+        if domain.startswith("www."):
+            domain = domain[4:]
+
+        # Check exact domain match first
+        if domain in self.AUTHORITY_DOMAINS:
+            return self.AUTHORITY_DOMAINS[domain]
+
+        # Check TLD matches (e.g., .gov, .edu) by probing each label
+        # suffix of the domain, longest first, instead of scanning every
+        # pattern with endswith()
+        dot = domain.find(".")
+        while dot != -1:
+            score = self._SUFFIX_SCORES.get(domain[dot:])
+            if score is not None:
+                return score
+            dot = domain.find(".", dot + 1)
+
+        return self.default_score
 
     def _calculate_signal_adjustment(self, metadata: Dict[str, Any]) -> float:
         """
@@ -195,6 +336,9 @@ class AuthorityScorer:
         """
         Get the category for a domain.
 
+        Matches whole domain labels against CATEGORY_SUFFIXES with a single
+        walk of a reversed-label trie, preferring the most specific suffix.
+
         Args:
             url: URL to categorize
 
@@ -202,34 +346,14 @@ class AuthorityScorer:
             Category string: 'official', 'news', 'academic', 'organization', 'social', 'unknown'
         """
         try:
-            parsed = urlparse(url)
-            domain = parsed.netloc.lower()
-
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            # Check for specific categories
-            if any(tld in domain for tld in [".gov", ".mil"]):
-                return "official"
-
-            if any(tld in domain for tld in [".edu", ".ac."]):
-                return "academic"
-
-            news_domains = [
-                "reuters.com", "apnews.com", "bbc.com", "nytimes.com",
-                "washingtonpost.com", "theguardian.com", "aljazeera.com",
-            ]
-            if any(news in domain for news in news_domains):
-                return "news"
-
-            if ".org" in domain:
-                return "organization"
-
-            social_domains = ["reddit.com", "twitter.com", "x.com", "facebook.com"]
-            if any(social in domain for social in social_domains):
-                return "social"
-
-            return "unknown"
+            domain = (urlparse(url).hostname or "").lower()
+            if not domain:
+                return "unknown"
+
+            _, category = _longest_suffix_match(
+                self._CATEGORY_TRIE, domain.split(".")[::-1]
+            )
+            return category or "unknown"
 
         except Exception:
             return "unknown"
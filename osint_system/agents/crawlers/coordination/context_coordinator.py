@@ -9,14 +9,21 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 import asyncio
+import sys
 
 from osint_system.agents.communication.bus import MessageBus
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityDiscovery:
     """Record of an entity discovery by a crawler."""
     entity: str
@@ -65,6 +72,10 @@ class ContextCoordinator:
         # Investigation-scoped tracking
         self._investigation_entities: Dict[str, Set[str]] = {}
 
+        # Automaton over tracked entities for cross_reference, rebuilt lazily
+        # after the entity set changes (only when pyahocorasick is installed)
+        self._entity_automaton: Optional[Any] = None
+
         logger.info(
             "ContextCoordinator initialized",
             extra={"broadcast_enabled": self.enable_broadcast},
@@ -84,6 +95,9 @@ class ContextCoordinator:
         Share a discovered entity with other crawlers.
 
         Records the discovery and optionally broadcasts via message bus.
+        All tracking updates happen synchronously before the broadcast is
+        awaited, so no lock is needed and concurrent calls never wait on
+        each other's publish.
 
         Args:
             entity: The discovered entity (name, term, etc.)
@@ -94,9 +108,6 @@ class ContextCoordinator:
             context: Surrounding text or context
             confidence: Confidence score for this discovery
         """
-        # Normalize entity for comparison
-        normalized_entity = entity.lower().strip()
-
         discovery = EntityDiscovery(
             entity=entity,
             entity_type=entity_type,
@@ -106,47 +117,106 @@ class ContextCoordinator:
             context=context,
             confidence=confidence,
         )
+        self._record_discovery(discovery)
+
+        # Broadcast via message bus if enabled (outside any critical section;
+        # keep it after the tracking updates above)
+        if self.enable_broadcast and self.message_bus:
+            await self._broadcast_discovery(discovery)
+
+    async def share_discoveries(self, discoveries: List[EntityDiscovery]) -> None:
+        """
+        Share a batch of discovered entities with other crawlers.
+
+        Records every discovery, then broadcasts them together as a single
+        "context.update.batch" message instead of one "context.update" per
+        entity. Subscribers needing per-entity handling iterate the
+        message's "discoveries" list.
+
+        Args:
+            discoveries: EntityDiscovery records to share
+        """
+        for discovery in discoveries:
+            self._record_discovery(discovery)
+
+        if (
+            discoveries
+            and self.enable_broadcast
+            and self.message_bus
+            and self.message_bus.has_subscribers("context.update.batch")
+        ):
+            try:
+                await self.message_bus.publish(
+                    "context.update.batch",
+                    {
+                        "type": "entities_discovered",
+                        "discoveries": [self._discovery_payload(d) for d in discoveries],
+                    },
+                )
+            except Exception as e:
+                logger.warning(f"Failed to broadcast discoveries: {e}")
+
+    def _record_discovery(self, discovery: EntityDiscovery) -> None:
+        """
+        Add a discovery to the entity and investigation indexes.
+
+        Args:
+            discovery: Discovery to track
+        """
+        # Normalize entity for comparison
+        normalized_entity = discovery.entity.lower().strip()
+
+        # The same URLs, crawler names and investigation IDs recur across
+        # many entities; interning keeps one shared copy of each string
+        discovery.source_url = sys.intern(discovery.source_url)
+        discovery.source_crawler = sys.intern(discovery.source_crawler)
+        discovery.investigation_id = sys.intern(discovery.investigation_id)
 
         # Track discovery
         if normalized_entity not in self._discovered_entities:
             self._discovered_entities[normalized_entity] = []
+            self._entity_automaton = None
         self._discovered_entities[normalized_entity].append(discovery)
 
         # Track investigation-scoped entities
+        investigation_id = discovery.investigation_id
         if investigation_id not in self._investigation_entities:
             self._investigation_entities[investigation_id] = set()
         self._investigation_entities[investigation_id].add(normalized_entity)
 
         logger.info(
-            f"Entity discovered: {entity} ({entity_type})",
+            f"Entity discovered: {discovery.entity} ({discovery.entity_type})",
             extra={
-                "entity": entity,
-                "type": entity_type,
-                "source": source_crawler,
+                "entity": discovery.entity,
+                "type": discovery.entity_type,
+                "source": discovery.source_crawler,
                 "investigation_id": investigation_id,
             },
         )
 
-        # Broadcast via message bus if enabled
-        if self.enable_broadcast and self.message_bus:
-            await self._broadcast_discovery(discovery)
+    @staticmethod
+    def _discovery_payload(discovery: EntityDiscovery) -> Dict[str, Any]:
+        """Build the message bus payload describing a discovery."""
+        return {
+            "type": "entity_discovered",
+            "entity": discovery.entity,
+            "entity_type": discovery.entity_type,
+            "source_url": discovery.source_url,
+            "source_crawler": discovery.source_crawler,
+            "investigation_id": discovery.investigation_id,
+            "context": discovery.context,
+            "confidence": discovery.confidence,
+            "timestamp": discovery.discovered_at.isoformat(),
+        }
 
     async def _broadcast_discovery(self, discovery: EntityDiscovery) -> None:
         """Broadcast entity discovery via message bus."""
+        # Skip building the payload when nobody listens for context updates
+        if not self.message_bus.has_subscribers("context.update"):
+            return
         try:
             await self.message_bus.publish(
-                "context.update",
-                {
-                    "type": "entity_discovered",
-                    "entity": discovery.entity,
-                    "entity_type": discovery.entity_type,
-                    "source_url": discovery.source_url,
-                    "source_crawler": discovery.source_crawler,
-                    "investigation_id": discovery.investigation_id,
-                    "context": discovery.context,
-                    "confidence": discovery.confidence,
-                    "timestamp": discovery.discovered_at.isoformat(),
-                },
+                "context.update", self._discovery_payload(discovery)
             )
         except Exception as e:
             logger.warning(f"Failed to broadcast discovery: {e}")
@@ -196,7 +266,9 @@ class ContextCoordinator:
         """
         Find known entities mentioned in content.
 
-        Searches content for mentions of tracked entities.
+        Searches content for mentions of tracked entities. When checking all
+        tracked entities and pyahocorasick is installed, a single automaton
+        pass over the content replaces one substring scan per entity.
 
         Args:
             content: Text content to search
@@ -210,6 +282,14 @@ class ContextCoordinator:
 
         if known_entities:
             entities_to_check = [e.lower().strip() for e in known_entities]
+        elif AHOCORASICK_AVAILABLE:
+            automaton = self._get_entity_automaton()
+            matched = (
+                {entity for _, entity in automaton.iter(content_lower)}
+                if automaton.kind == ahocorasick.AHOCORASICK
+                else set()
+            )
+            return [e for e in self._discovered_entities if e in matched or not e]
         else:
             entities_to_check = list(self._discovered_entities.keys())
 
@@ -220,6 +300,27 @@ class ContextCoordinator:
 
         return found
 
+    def _get_entity_automaton(self) -> Any:
+        """
+        Return the Aho-Corasick automaton over tracked entities.
+
+        Built on first use after the entity set changes. Empty entity keys
+        are left out since the automaton cannot hold empty words.
+
+        Returns:
+            Finalized ahocorasick.Automaton mapping each entity to itself
+        """
+        if self._entity_automaton is None:
+            automaton = ahocorasick.Automaton()
+            for entity in self._discovered_entities:
+                if entity:
+                    automaton.add_word(entity, entity)
+            # An automaton with no words stays EMPTY and cannot be searched
+            if len(automaton):
+                automaton.make_automaton()
+            self._entity_automaton = automaton
+        return self._entity_automaton
+
     def add_related_topic(
         self,
         original_topic: str,
@@ -323,6 +424,7 @@ class ContextCoordinator:
                 self._discovered_entities[entity_key] = remaining
             else:
                 del self._discovered_entities[entity_key]
+                self._entity_automaton = None
 
         # Clear related topics
         keys_to_remove = [
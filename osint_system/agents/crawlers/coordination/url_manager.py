@@ -8,6 +8,7 @@ appear in different investigations.
 from typing import Optional, Set, Dict
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 import logging
 
 from yarl import URL
@@ -35,10 +36,13 @@ TRACKING_PARAMS: frozenset[str] = frozenset({
     "vero_id", "nr_email_referer", "mkt_tok",
 })
 
+# Lowercased once so normalize_url can match query keys case-insensitively
+_TRACKING_PARAMS_LOWER: frozenset[str] = frozenset(p.lower() for p in TRACKING_PARAMS)
 
-@dataclass
+
+@dataclass(slots=True)
 class URLEntry:
-    """Metadata for a tracked URL."""
+    """Metadata for a tracked URL (slotted: one instance per tracked URL)."""
     normalized_url: str
     original_url: str
     domain: str
@@ -61,6 +65,10 @@ class URLManager:
 
     Same URL can appear in different investigations, preventing cross-investigation
     pollution while ensuring deduplication within an investigation.
+
+    All methods are synchronous. Crawlers sharing a manager on one event loop
+    cannot interleave inside add_url's check-then-insert, so the index needs
+    no locks or sharding.
     """
 
     def __init__(self, strip_tracking_params: bool = True, normalize_case: bool = True):
@@ -69,16 +77,15 @@ class URLManager:
 
         Args:
             strip_tracking_params: Remove tracking parameters during normalization
-            normalize_case: Lowercase domain during normalization
+            normalize_case: Lowercase domain during normalization (yarl
+                already returns lowercased hosts, so this is always the case)
         """
         self.strip_tracking_params = strip_tracking_params
         self.normalize_case = normalize_case
 
-        # investigation_id -> set of normalized URLs for O(1) lookup
-        self._seen_urls: Dict[str, Set[str]] = {}
-
-        # Detailed tracking: (investigation_id, normalized_url) -> URLEntry
-        self._url_entries: Dict[tuple[str, str], URLEntry] = {}
+        # investigation_id -> {normalized_url -> URLEntry}; the inner dict's
+        # keys double as the O(1) membership set, so each URL is held once
+        self._url_entries: Dict[str, Dict[str, URLEntry]] = {}
 
         logger.info(
             f"URLManager initialized (strip_tracking={strip_tracking_params}, "
@@ -91,7 +98,7 @@ class URLManager:
 
         Normalization steps:
         1. Parse with yarl (handles encoding, IDNA)
-        2. Lowercase host if normalize_case enabled
+        2. Lowercase host (done by yarl when parsing)
         3. Remove tracking parameters
         4. Remove fragments
         5. Normalize path (remove trailing slash unless root)
@@ -104,37 +111,57 @@ class URLManager:
         Returns:
             Normalized URL string suitable for deduplication
 
+        Raises:
+            ValueError: If URL cannot be parsed
+        """
+        return self._normalize_parsed(self._parse(url), url)
+
+    def _parse(self, url: str) -> URL:
+        """
+        Parse a URL string with yarl.
+
+        Args:
+            url: Raw URL string
+
+        Returns:
+            Parsed yarl URL
+
         Raises:
             ValueError: If URL cannot be parsed
         """
         try:
-            parsed = URL(url)
+            return URL(url)
         except Exception as e:
             logger.warning(f"Failed to parse URL '{url}': {e}")
             raise ValueError(f"Invalid URL: {url}") from e
 
+    def _normalize_parsed(self, parsed: URL, url: str) -> str:
+        """
+        Build the normalized form of an already parsed URL.
+
+        Args:
+            parsed: yarl URL parsed from url
+            url: Raw URL string, returned as-is when relative
+
+        Returns:
+            Normalized URL string suitable for deduplication
+        """
         # Handle relative URLs by returning as-is
         if not parsed.is_absolute():
             logger.debug(f"Relative URL passed, returning as-is: {url}")
             return url
 
-        # Lowercase host if configured
+        # yarl lowercases (and IDNA-decodes) the host while parsing, so no
+        # further case folding is needed
         host = parsed.host or ""
-        if self.normalize_case and host:
-            host = host.lower()
 
-        # Filter query parameters
+        # Filter query parameters in a single pass over the parsed pairs;
+        # the stable sort keeps repeated keys in their original order
         if parsed.query_string:
-            filtered_params = []
-            for key in sorted(parsed.query.keys()):
-                if not self.strip_tracking_params or key.lower() not in TRACKING_PARAMS:
-                    filtered_params.append((key, parsed.query[key]))
-
-            # Reconstruct query string
-            if filtered_params:
-                query_string = "&".join(f"{k}={v}" for k, v in filtered_params)
-            else:
-                query_string = ""
+            params = sorted(parsed.query.items(), key=itemgetter(0))
+            if self.strip_tracking_params:
+                params = [(k, v) for k, v in params if k.lower() not in _TRACKING_PARAMS_LOWER]
+            query_string = "&".join(f"{k}={v}" for k, v in params)
         else:
             query_string = ""
 
@@ -179,11 +206,7 @@ class URLManager:
             ValueError: If URL cannot be parsed
         """
         try:
-            parsed = URL(url)
-            domain = parsed.host or ""
-            if self.normalize_case:
-                domain = domain.lower()
-            return domain
+            return URL(url).host or ""
         except Exception as e:
             logger.warning(f"Failed to extract domain from '{url}': {e}")
             raise ValueError(f"Cannot extract domain from: {url}") from e
@@ -202,27 +225,24 @@ class URLManager:
         Returns:
             True if URL was new for this investigation, False if duplicate
         """
-        normalized = self.normalize_url(url)
-
-        # Ensure investigation set exists
-        if investigation_id not in self._seen_urls:
-            self._seen_urls[investigation_id] = set()
+        # Parse once; normalization and the domain both come from it
+        parsed = self._parse(url)
+        normalized = self._normalize_parsed(parsed, url)
+        entries = self._url_entries.setdefault(investigation_id, {})
 
         # Check for duplicate
-        if normalized in self._seen_urls[investigation_id]:
+        entry = entries.get(normalized)
+        if entry is not None:
             # Update crawl count
-            key = (investigation_id, normalized)
-            if key in self._url_entries:
-                self._url_entries[key].crawl_count += 1
+            entry.crawl_count += 1
             logger.debug(f"Duplicate URL for investigation {investigation_id}: {url}")
             return False
 
         # Add new URL
-        self._seen_urls[investigation_id].add(normalized)
-        self._url_entries[(investigation_id, normalized)] = URLEntry(
+        entries[normalized] = URLEntry(
             normalized_url=normalized,
             original_url=url,
-            domain=self.extract_domain(url),
+            domain=parsed.host or "",
             investigation_id=investigation_id,
         )
 
@@ -233,7 +253,7 @@ class URLManager:
         """
         Check if URL is a duplicate for an investigation.
 
-        O(1) lookup using normalized URL in set.
+        O(1) lookup using normalized URL as dict key.
 
         Args:
             url: URL to check
@@ -248,10 +268,7 @@ class URLManager:
             # Invalid URLs are considered unique to allow error handling downstream
             return False
 
-        if investigation_id not in self._seen_urls:
-            return False
-
-        return normalized in self._seen_urls[investigation_id]
+        return normalized in self._url_entries.get(investigation_id, {})
 
     def get_entry(self, url: str, investigation_id: str) -> Optional[URLEntry]:
         """
@@ -269,7 +286,7 @@ class URLManager:
         except ValueError:
             return None
 
-        return self._url_entries.get((investigation_id, normalized))
+        return self._url_entries.get(investigation_id, {}).get(normalized)
 
     def get_investigation_urls(self, investigation_id: str) -> Set[str]:
         """
@@ -281,7 +298,7 @@ class URLManager:
         Returns:
             Set of normalized URL strings
         """
-        return self._seen_urls.get(investigation_id, set()).copy()
+        return set(self._url_entries.get(investigation_id, {}))
 
     def get_url_count(self, investigation_id: str) -> int:
         """
@@ -293,7 +310,7 @@ class URLManager:
         Returns:
             Number of unique URLs
         """
-        return len(self._seen_urls.get(investigation_id, set()))
+        return len(self._url_entries.get(investigation_id, {}))
 
     def clear_investigation(self, investigation_id: str) -> int:
         """
@@ -305,18 +322,7 @@ class URLManager:
         Returns:
             Number of URLs cleared
         """
-        count = len(self._seen_urls.get(investigation_id, set()))
-
-        if investigation_id in self._seen_urls:
-            del self._seen_urls[investigation_id]
-
-        # Clean up entries
-        keys_to_remove = [
-            key for key in self._url_entries
-            if key[0] == investigation_id
-        ]
-        for key in keys_to_remove:
-            del self._url_entries[key]
+        count = len(self._url_entries.pop(investigation_id, {}))
 
         logger.info(f"Cleared {count} URLs for investigation {investigation_id}")
         return count
@@ -329,9 +335,9 @@ class URLManager:
             Dictionary with counts by investigation and total
         """
         stats = {
-            "total_urls": len(self._url_entries),
-            "investigations": len(self._seen_urls),
+            "total_urls": sum(len(entries) for entries in self._url_entries.values()),
+            "investigations": len(self._url_entries),
         }
-        for inv_id, urls in self._seen_urls.items():
-            stats[f"investigation_{inv_id}"] = len(urls)
+        for inv_id, entries in self._url_entries.items():
+            stats[f"investigation_{inv_id}"] = len(entries)
         return stats
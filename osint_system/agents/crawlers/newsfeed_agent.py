@@ -181,7 +181,13 @@ class NewsFeedAgent(BaseCrawler):
             )
 
     async def __aenter__(self):
-        """Async context manager entry - initialize HTTP client, MCP, and message bus."""
+        """
+        Async context manager entry - initialize HTTP client, MCP, and message bus.
+
+        Message bus subscriptions are registered synchronously, so they are
+        in place by the time this returns and callers may publish straight
+        away.
+        """
         # Initialize HTTP client with connection pooling and proper headers
         limits = httpx.Limits(max_keepalive_connections=5, max_connections=20)
         self.http_client = httpx.AsyncClient(
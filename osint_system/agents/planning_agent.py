@@ -2,6 +2,7 @@
 
 import json
 import uuid
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any, Optional, Literal, AsyncIterator
 import asyncio
@@ -773,8 +774,7 @@ Respond with ONLY the JSON array, no other text."""
 
         # Update coverage metrics
         if self.coverage_metrics:
-            for finding in findings:
-                self.coverage_metrics.update_from_finding(finding)
+            self.coverage_metrics.update_from_findings(findings)
 
             coverage = self.coverage_metrics.get_overall_coverage()
         else:
@@ -876,7 +876,7 @@ Respond with ONLY the JSON array, no other text."""
         finding_score = min(len(findings) / 10.0, 1.0)
 
         # Average confidence
-        confidences = [f.get("confidence", 0.5) for f in findings if isinstance(f, dict)]
+        confidences = [f.get("confidence", 0.5) for f in findings if isinstance(f, Mapping)]
         confidence_score = sum(confidences) / len(confidences) if confidences else 0.0
 
         # Weighted combination
@@ -1015,6 +1015,20 @@ Respond with ONLY the JSON array, no other text."""
             "next_action": "end",
         }
 
+    def reset(self) -> None:
+        """
+        Clear per-investigation state so the orchestrator can be reused.
+
+        Drops queued tasks, coverage metrics, the diminishing-returns
+        baseline, refinement history and tracked conflicts. Configuration,
+        clients and the compiled graph are kept.
+        """
+        self.task_queue = TaskQueue()
+        self.coverage_metrics = None
+        self.previous_findings = []
+        self.refinement_engine = RefinementEngine(max_iterations=self.max_refinements)
+        self.conflicts = []
+
     def get_status(self) -> dict:
         """
         Get current orchestration status and reasoning.
@@ -1178,6 +1192,11 @@ Respond with ONLY the JSON array, no other text."""
         """
         return self.conflicts.copy()
 
+    @property
+    def conflict_count(self) -> int:
+        """Number of tracked conflicts, without copying the report."""
+        return len(self.conflicts)
+
     def get_reasoning_trace(self) -> str:
         """
         Get complete decision history showing all reasoning.
@@ -1250,7 +1269,7 @@ Respond with ONLY the JSON array, no other text."""
             "**Transparency:**",
             "- Complete reasoning trace available",
             "- All routing decisions explained",
-            f"- {len(self.conflicts)} conflicts tracked",
+            f"- {self.conflict_count} conflicts tracked",
             ""
         ]
 
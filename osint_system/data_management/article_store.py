@@ -15,6 +15,7 @@ Embedding wiring:
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
 
 from osint_system.data_management.models.article import ArticleModel
 
+# Rows per multi-row upsert; 12 bind parameters each keeps a statement well
+# under asyncpg's 32767-parameter limit.
+_UPSERT_BATCH_SIZE = 1000
+
 
 class ArticleStore:
     """PostgreSQL-backed storage for crawled articles.
@@ -69,7 +74,10 @@ class ArticleStore:
         """Save articles for a specific investigation.
 
         Deduplicates by ``article_id`` (SHA256 of URL).  Existing articles
-        with the same URL are updated in place.
+        with the same URL are updated in place and counted as ``updated``;
+        which URLs already exist is resolved with a single batched lookup,
+        and rows are written with multi-row upserts rather than one
+        statement per article.
 
         Args:
             investigation_id: Unique investigation identifier.
@@ -85,6 +93,10 @@ class ArticleStore:
 
         async with self._session_factory() as session:
             async with session.begin():
+                # One storage timestamp for the whole batch
+                stored_at = datetime.now(timezone.utc).isoformat()
+
+                models: List[ArticleModel] = []
                 for article_data in articles:
                     url = article_data.get("url", "")
                     if not url:
@@ -97,30 +109,64 @@ class ArticleStore:
                     # Stamp storage time
                     enriched = {
                         **article_data,
-                        "stored_at": datetime.now(timezone.utc).isoformat(),
+                        "stored_at": stored_at,
                     }
+                    models.append(ArticleModel.from_dict(enriched, investigation_id))
+
+                # Membership pre-check for the whole batch in one probe of
+                # the article_id unique index, so saved vs updated is known
+                # before any upsert is issued.
+                seen_ids: set[str] = set()
+                if models:
+                    seen_ids.update(
+                        (
+                            await session.execute(
+                                select(ArticleModel.article_id).where(
+                                    ArticleModel.article_id.in_(
+                                        {m.article_id for m in models}
+                                    )
+                                )
+                            )
+                        ).scalars()
+                    )
 
-                    model = ArticleModel.from_dict(enriched, investigation_id)
+                # Resolve saved vs updated and collapse in-batch repeats of
+                # the same URL (last one wins), since a multi-row upsert
+                # cannot touch the same conflict key twice.
+                rows: Dict[str, Dict[str, Any]] = {}
+                for model in models:
+                    if model.article_id in seen_ids:
+                        updated_count += 1
+                    else:
+                        seen_ids.add(model.article_id)
+                        saved_count += 1
 
                     # Generate embedding if service available
                     if self._embedding_service is not None:
                         text = f"{model.title or ''} {model.content or ''}".strip()
                         model.embedding = await self._embedding_service.embed(text)
 
-                    # Upsert: INSERT ... ON CONFLICT (article_id) DO UPDATE
+                    rows[model.article_id] = {
+                        "article_id": model.article_id,
+                        "investigation_id": model.investigation_id,
+                        "url": model.url,
+                        "title": model.title,
+                        "content": model.content,
+                        "published_date": model.published_date,
+                        "source_name": model.source_name,
+                        "source_domain": model.source_domain,
+                        "stored_at": model.stored_at,
+                        "source_metadata": model.source_metadata,
+                        "article_metadata": model.article_metadata,
+                        "embedding": model.embedding,
+                    }
+
+                # Upsert: multi-row INSERT ... ON CONFLICT (article_id) DO
+                # UPDATE, chunked to stay under the driver's bind-parameter cap.
+                values = list(rows.values())
+                for i in range(0, len(values), _UPSERT_BATCH_SIZE):
                     stmt = pg_insert(ArticleModel).values(
-                        article_id=model.article_id,
-                        investigation_id=model.investigation_id,
-                        url=model.url,
-                        title=model.title,
-                        content=model.content,
-                        published_date=model.published_date,
-                        source_name=model.source_name,
-                        source_domain=model.source_domain,
-                        stored_at=model.stored_at,
-                        source_metadata=model.source_metadata,
-                        article_metadata=model.article_metadata,
-                        embedding=model.embedding,
+                        values[i:i + _UPSERT_BATCH_SIZE],
                     )
                     stmt = stmt.on_conflict_do_update(
                         index_elements=["article_id"],
@@ -136,18 +182,7 @@ class ArticleStore:
                             "embedding": stmt.excluded.embedding,
                         },
                     )
-                    result = await session.execute(stmt)
-
-                    # rowcount == 1 for both insert and update with ON CONFLICT.
-                    # We cannot distinguish insert from update directly here,
-                    # but we can check if the article_id existed before.
-                    # For simplicity and identical return semantics, count as
-                    # "saved" on every successful upsert (matches original
-                    # behavior where save_articles always increments saved_count
-                    # for new URLs and updated_count for existing ones).
-                    # We use a separate existence check.
-                    if result.rowcount:
-                        saved_count += 1
+                    await session.execute(stmt)
 
             # Count total articles for this investigation
             total_q = select(func.count()).select_from(ArticleModel).where(
@@ -293,6 +328,9 @@ class ArticleStore:
     ) -> Dict[str, Any]:
         """Get statistics for an investigation.
 
+        The source breakdown is aggregated in PostgreSQL over the
+        ``source_name`` column alone, so no article rows are loaded.
+
         Args:
             investigation_id: Investigation identifier.
 
@@ -300,10 +338,12 @@ class ArticleStore:
             Dict with exists flag, counts, and source breakdown.
         """
         async with self._session_factory() as session:
-            q = select(ArticleModel).where(
-                ArticleModel.investigation_id == investigation_id,
+            q = (
+                select(ArticleModel.source_name, func.count().label("cnt"))
+                .where(ArticleModel.investigation_id == investigation_id)
+                .group_by(ArticleModel.source_name)
             )
-            rows = (await session.execute(q)).scalars().all()
+            rows = (await session.execute(q)).all()
 
             if not rows:
                 return {
@@ -311,18 +351,18 @@ class ArticleStore:
                     "investigation_id": investigation_id,
                 }
 
-            source_counts: Dict[str, int] = {}
+            # NULL and empty source names both fold into "Unknown"
+            source_counts: Counter[str] = Counter()
             for row in rows:
-                name = row.source_name or "Unknown"
-                source_counts[name] = source_counts.get(name, 0) + 1
+                source_counts[row.source_name or "Unknown"] += row.cnt
 
             return {
                 "exists": True,
                 "investigation_id": investigation_id,
-                "total_articles": len(rows),
+                "total_articles": sum(source_counts.values()),
                 "created_at": None,
                 "updated_at": None,
-                "source_breakdown": source_counts,
+                "source_breakdown": dict(source_counts),
                 "metadata": {},
             }
 
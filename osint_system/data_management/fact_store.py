@@ -24,8 +24,9 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import Select, case, delete, func, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import defer
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
@@ -39,6 +40,19 @@ from osint_system.data_management.models.fact import FactModel
 _log = logging.getLogger(__name__)
 
 
+def _select_facts() -> Select[tuple[FactModel]]:
+    """SELECT over facts that skips the heavy search-only columns.
+
+    The 768-dim ``embedding`` vector and the ``claim_tsvector`` are never
+    read by ``FactModel.to_dict()`` or by variant linking, so deferring
+    them keeps each hydrated row to the fields FactStore actually uses.
+    """
+    return select(FactModel).options(
+        defer(FactModel.embedding),
+        defer(FactModel.claim_tsvector),
+    )
+
+
 class FactStore:
     """PostgreSQL-backed storage for extracted facts.
 
@@ -78,7 +92,9 @@ class FactStore:
         """Save facts for a specific investigation.
 
         Detects duplicates by ``fact_id`` (unique constraint).  Content-hash
-        collisions trigger variant linking.
+        collisions trigger variant linking.  Existing fact_ids and canonical
+        hash matches are fetched once per batch, so database round trips do
+        not grow with the number of facts (entity upserts aside).
 
         Args:
             investigation_id: Unique investigation identifier.
@@ -94,6 +110,22 @@ class FactStore:
 
         async with self._session_factory() as session:
             async with session.begin():
+                # One round trip for the whole batch instead of a SELECT
+                # per fact: which incoming fact_ids are already stored.
+                batch_ids = [f["fact_id"] for f in facts if f.get("fact_id")]
+                seen_ids: set[str] = set()
+                if batch_ids:
+                    seen_ids.update(
+                        (
+                            await session.execute(
+                                select(FactModel.fact_id).where(
+                                    FactModel.fact_id.in_(batch_ids)
+                                )
+                            )
+                        ).scalars()
+                    )
+
+                new_models: List[tuple[FactModel, Dict[str, Any]]] = []
                 for fact_data in facts:
                     fact_id = fact_data.get("fact_id")
                     if not fact_id:
@@ -101,17 +133,12 @@ class FactStore:
                         skipped_count += 1
                         continue
 
-                    # Check if this exact fact_id already exists
-                    existing = (
-                        await session.execute(
-                            select(FactModel).where(FactModel.fact_id == fact_id)
-                        )
-                    ).scalar_one_or_none()
-
-                    if existing is not None:
+                    # Already stored, or repeated earlier in this batch
+                    if fact_id in seen_ids:
                         self.logger.debug(f"Fact {fact_id} already exists, skipping")
                         skipped_count += 1
                         continue
+                    seen_ids.add(fact_id)
 
                     # Stamp storage time and ensure variants list
                     enriched = {
@@ -128,37 +155,52 @@ class FactStore:
                             model.claim_text
                         )
 
-                    # Variant linking: check for hash duplicates within
-                    # this investigation
-                    content_hash = model.content_hash
-                    if content_hash:
-                        hash_matches = (
-                            await session.execute(
-                                select(FactModel).where(
-                                    FactModel.content_hash == content_hash,
-                                    FactModel.investigation_id == investigation_id,
-                                )
-                            )
-                        ).scalars().all()
-
-                        if hash_matches:
-                            canonical = hash_matches[0]
-                            # Append this fact_id to canonical's variants
-                            canonical_variants = list(canonical.variants or [])
-                            if fact_id not in canonical_variants:
-                                canonical_variants.append(fact_id)
-                                canonical.variants = canonical_variants
-
-                            # Link back: mark canonical in new fact's variants
-                            new_variants = list(model.variants or [])
-                            if canonical.fact_id not in new_variants:
-                                new_variants.append(canonical.fact_id)
-                                model.variants = new_variants
-
-                            updated_count += 1
-                            self.logger.debug(
-                                f"Linked {fact_id} as variant of {canonical.fact_id}"
+                    new_models.append((model, enriched))
+
+                # Variant linking: resolve the canonical (earliest stored)
+                # fact for every content hash in the batch with one query.
+                batch_hashes = {m.content_hash for m, _ in new_models if m.content_hash}
+                canonical_by_hash: Dict[str, FactModel] = {}
+                if batch_hashes:
+                    hash_rows = (
+                        await session.execute(
+                            _select_facts()
+                            .where(
+                                FactModel.content_hash.in_(batch_hashes),
+                                FactModel.investigation_id == investigation_id,
                             )
+                            .order_by(FactModel.id)
+                        )
+                    ).scalars()
+                    for row in hash_rows:
+                        canonical_by_hash.setdefault(row.content_hash, row)
+
+                for model, enriched in new_models:
+                    fact_id = model.fact_id
+                    content_hash = model.content_hash
+                    canonical = canonical_by_hash.get(content_hash) if content_hash else None
+
+                    if canonical is not None:
+                        # Append this fact_id to canonical's variants
+                        canonical_variants = set(canonical.variants or ())
+                        if fact_id not in canonical_variants:
+                            canonical_variants.add(fact_id)
+                            canonical.variants = sorted(canonical_variants)
+
+                        # Link back: mark canonical in new fact's variants
+                        new_variants = set(model.variants or ())
+                        if canonical.fact_id not in new_variants:
+                            new_variants.add(canonical.fact_id)
+                            model.variants = sorted(new_variants)
+
+                        updated_count += 1
+                        self.logger.debug(
+                            f"Linked {fact_id} as variant of {canonical.fact_id}"
+                        )
+                    elif content_hash:
+                        # First occurrence becomes canonical for later
+                        # same-hash facts in this batch
+                        canonical_by_hash[content_hash] = model
 
                     session.add(model)
                     saved_count += 1
@@ -289,7 +331,7 @@ class FactStore:
         async with self._session_factory() as session:
             row = (
                 await session.execute(
-                    select(FactModel).where(
+                    _select_facts().where(
                         FactModel.fact_id == fact_id,
                         FactModel.investigation_id == investigation_id,
                     )
@@ -314,7 +356,7 @@ class FactStore:
         async with self._session_factory() as session:
             row = (
                 await session.execute(
-                    select(FactModel).where(FactModel.fact_id == fact_id)
+                    _select_facts().where(FactModel.fact_id == fact_id)
                 )
             ).scalar_one_or_none()
 
@@ -339,7 +381,7 @@ class FactStore:
             List of fact dicts with matching hash.
         """
         async with self._session_factory() as session:
-            q = select(FactModel).where(FactModel.content_hash == content_hash)
+            q = _select_facts().where(FactModel.content_hash == content_hash)
 
             if investigation_id is not None:
                 q = q.where(FactModel.investigation_id == investigation_id)
@@ -358,7 +400,9 @@ class FactStore:
     ) -> List[Dict[str, Any]]:
         """Retrieve all facts from a given source.
 
-        Uses JSONB containment query on the provenance column.
+        Filters on the indexed ``source_url`` column, which ``FactModel``
+        populates from ``provenance.source_id`` at insert time, so the
+        lookup is an index scan rather than a JSONB extraction per row.
 
         Args:
             source_id: Source identifier (typically URL).
@@ -368,10 +412,7 @@ class FactStore:
             List of fact dicts from the source.
         """
         async with self._session_factory() as session:
-            # provenance is JSONB with {"source_id": "..."} structure
-            q = select(FactModel).where(
-                FactModel.provenance["source_id"].astext == source_id,
-            )
+            q = _select_facts().where(FactModel.source_url == source_id)
 
             if investigation_id is not None:
                 q = q.where(FactModel.investigation_id == investigation_id)
@@ -418,7 +459,7 @@ class FactStore:
                 }
 
             q = (
-                select(FactModel)
+                _select_facts()
                 .where(FactModel.investigation_id == investigation_id)
                 .order_by(FactModel.id)
                 .offset(offset)
@@ -450,6 +491,9 @@ class FactStore:
     ) -> bool:
         """Check if a content hash exists.
 
+        Uses ``EXISTS`` rather than ``COUNT(*)`` so PostgreSQL stops at the
+        first ``content_hash`` index hit instead of counting every match.
+
         Args:
             content_hash: SHA256 content hash to check.
             investigation_id: Optional filter by investigation.
@@ -458,14 +502,13 @@ class FactStore:
             True if hash exists, False otherwise.
         """
         async with self._session_factory() as session:
-            q = select(func.count()).select_from(FactModel).where(
+            q = select(FactModel.id).where(
                 FactModel.content_hash == content_hash,
             )
             if investigation_id is not None:
                 q = q.where(FactModel.investigation_id == investigation_id)
 
-            count = (await session.execute(q)).scalar() or 0
-            return count > 0
+            return bool((await session.execute(select(q.exists()))).scalar())
 
     # ------------------------------------------------------------------
     # get_stats
@@ -477,56 +520,66 @@ class FactStore:
         Args:
             investigation_id: Investigation identifier.
 
+        Aggregates are computed by PostgreSQL (one summary row plus a
+        grouped source breakdown) rather than materializing every fact.
+
         Returns:
             Dict with exists flag, counts, and source breakdown.
         """
-        async with self._session_factory() as session:
-            q = select(FactModel).where(
-                FactModel.investigation_id == investigation_id,
+        has_variants = (
+            case(
+                (
+                    func.jsonb_typeof(FactModel.variants) == "array",
+                    func.jsonb_array_length(FactModel.variants),
+                ),
+                else_=0,
             )
-            rows = (await session.execute(q)).scalars().all()
+            > 0
+        )
+
+        async with self._session_factory() as session:
+            summary = (
+                await session.execute(
+                    select(
+                        func.count().label("total"),
+                        func.count(
+                            func.distinct(func.nullif(FactModel.content_hash, ""))
+                        ).label("unique_claims"),
+                        func.count().filter(has_variants).label("with_variants"),
+                    ).where(FactModel.investigation_id == investigation_id)
+                )
+            ).one()
 
-            if not rows:
+            if not summary.total:
                 return {
                     "exists": False,
                     "investigation_id": investigation_id,
                 }
 
-            source_counts: Dict[str, int] = {}
-            variant_count = 0
-            unique_hashes: set[str] = set()
-            hash_collision_count = 0
-
-            for row in rows:
-                # Source breakdown from provenance JSONB
-                prov = row.provenance
-                if isinstance(prov, dict):
-                    src = prov.get("source_id", "")
-                    if src:
-                        source_counts[src] = source_counts.get(src, 0) + 1
-
-                # Variant tracking
-                if row.variants:
-                    variant_count += 1
-
-                # Unique hashes
-                ch = row.content_hash or ""
-                if ch:
-                    if ch in unique_hashes:
-                        hash_collision_count += 1
-                    unique_hashes.add(ch)
-
-            return {
-                "exists": True,
-                "investigation_id": investigation_id,
-                "total_facts": len(rows),
-                "unique_claims": len(unique_hashes),
-                "facts_with_variants": variant_count,
-                "created_at": None,
-                "updated_at": None,
-                "source_breakdown": source_counts,
-                "metadata": {},
-            }
+            # source_url mirrors provenance.source_id (see FactModel.from_dict)
+            source_rows = (
+                await session.execute(
+                    select(FactModel.source_url, func.count())
+                    .where(
+                        FactModel.investigation_id == investigation_id,
+                        FactModel.source_url.isnot(None),
+                        FactModel.source_url != "",
+                    )
+                    .group_by(FactModel.source_url)
+                )
+            ).all()
+
+        return {
+            "exists": True,
+            "investigation_id": investigation_id,
+            "total_facts": summary.total,
+            "unique_claims": summary.unique_claims,
+            "facts_with_variants": summary.with_variants,
+            "created_at": None,
+            "updated_at": None,
+            "source_breakdown": {src: cnt for src, cnt in source_rows},
+            "metadata": {},
+        }
 
     # ------------------------------------------------------------------
     # list_investigations
@@ -619,7 +672,7 @@ class FactStore:
                 # Load canonical
                 canonical = (
                     await session.execute(
-                        select(FactModel).where(
+                        _select_facts().where(
                             FactModel.fact_id == canonical_id,
                             FactModel.investigation_id == investigation_id,
                         )
@@ -638,7 +691,7 @@ class FactStore:
                     # Verify variant exists in this investigation
                     variant_row = (
                         await session.execute(
-                            select(FactModel).where(
+                            _select_facts().where(
                                 FactModel.fact_id == variant_id,
                                 FactModel.investigation_id == investigation_id,
                             )
@@ -651,12 +704,13 @@ class FactStore:
                     existing_variants.add(variant_id)
 
                     # Also update the variant to reference canonical
-                    var_variants = list(variant_row.variants or [])
+                    var_variants = set(variant_row.variants or ())
                     if canonical_id not in var_variants:
-                        var_variants.append(canonical_id)
-                        variant_row.variants = var_variants
+                        var_variants.add(canonical_id)
+                        variant_row.variants = sorted(var_variants)
 
-                canonical.variants = list(existing_variants)
+                # Sets for O(1) membership/dedup; JSONB stores a sorted list
+                canonical.variants = sorted(existing_variants)
 
         return True
 
@@ -9,7 +9,8 @@ relationships, variants) as JSONB.
 Includes:
 - pgvector embedding (1024 dims) with HNSW index for semantic search
 - tsvector computed column with GIN index for full-text search on claim_text
-- content_hash index for exact-match deduplication
+- content_hash hash index for exact-match deduplication
+- source_url index for by-source retrieval
 
 The ``from_dict``/``to_dict`` methods preserve the exact dict shape that
 FactStore currently returns, ensuring zero-breakage migration.
@@ -53,9 +54,7 @@ class FactModel(TimestampMixin, Base):
     investigation_id: Mapped[str] = mapped_column(
         String(64), index=True,
     )
-    content_hash: Mapped[str] = mapped_column(
-        String(64), index=True,
-    )
+    content_hash: Mapped[str] = mapped_column(String(64))
 
     # Core claim columns (promoted from nested claim object)
     claim_text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -63,8 +62,10 @@ class FactModel(TimestampMixin, Base):
         String(32), default="statement",
     )
 
-    # Source reference
-    source_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Source reference (mirrors provenance.source_id; indexed for by-source lookup)
+    source_url: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, index=True,
+    )
 
     # Quality scores (promoted from quality sub-object)
     extraction_confidence: Mapped[Optional[float]] = mapped_column(
@@ -119,6 +120,13 @@ class FactModel(TimestampMixin, Base):
     )
 
     __table_args__ = (
+        # Equality-only dedup probes (=, IN): a hash index stores a 32-bit
+        # hash per row instead of the full 64-char hex digest.
+        Index(
+            "ix_facts_content_hash",
+            "content_hash",
+            postgresql_using="hash",
+        ),
         Index(
             "ix_facts_claim_fts",
             "claim_tsvector",
@@ -174,11 +182,6 @@ class FactModel(TimestampMixin, Base):
         quality = data.get("quality", {}) or {}
         provenance = data.get("provenance")
 
-        # Extract source_url from provenance if available
-        source_url = None
-        if isinstance(provenance, dict):
-            source_url = provenance.get("source_id")
-
         # Compute content_hash if missing
         content_hash = data.get("content_hash", "")
         claim_text = claim.get("text", "") if isinstance(claim, dict) else str(claim)
@@ -219,6 +222,11 @@ class FactModel(TimestampMixin, Base):
             elif isinstance(provenance, dict):
                 provenance_dict = provenance
 
+        # Promote provenance.source_id to the indexed source_url column
+        source_url = None
+        if provenance_dict is not None:
+            source_url = provenance_dict.get("source_id")
+
         # Serialize quality metrics
         quality_dict: dict[str, Any] | None = None
         if quality:
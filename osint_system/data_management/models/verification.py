@@ -15,7 +15,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -94,6 +94,11 @@ class VerificationModel(TimestampMixin, Base):
             "investigation_id", "fact_id",
             name="uq_verifications_inv_fact",
         ),
+        # Status buckets per investigation for VerificationStore.get_by_status
+        Index(
+            "ix_verifications_inv_status",
+            "investigation_id", "status",
+        ),
     )
 
     @classmethod
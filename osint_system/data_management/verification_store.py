@@ -26,6 +26,7 @@ from typing import Any, Optional
 
 import structlog
 from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from osint_system.data_management.models.verification import VerificationModel
@@ -80,49 +81,54 @@ class VerificationStore:
     async def save_result(self, result: VerificationResult) -> None:
         """Save a verification result.
 
-        Creates VerificationResultRecord from result and persists via
-        upsert on the (investigation_id, fact_id) unique constraint.
+        Creates VerificationResultRecord from result and persists via a
+        single INSERT ... ON CONFLICT on the (investigation_id, fact_id)
+        unique constraint.
 
         Args:
             result: VerificationResult to store.
         """
         inv_id = result.investigation_id
         record = VerificationResultRecord.from_result(result)
-        record_data = record.model_dump(mode="json")
+        model = VerificationModel.from_dict(record, inv_id)
+
+        # Upsert: INSERT ... ON CONFLICT (investigation_id, fact_id) DO UPDATE
+        # -- one round trip keyed on the composite unique constraint.
+        stmt = pg_insert(VerificationModel).values(
+            fact_id=model.fact_id,
+            investigation_id=model.investigation_id,
+            status=model.status,
+            original_confidence=model.original_confidence,
+            confidence_boost=model.confidence_boost,
+            final_confidence=model.final_confidence,
+            search_count=model.search_count,
+            supporting_evidence=model.supporting_evidence,
+            refuting_evidence=model.refuting_evidence,
+            queries_used=model.queries_used,
+            origin_dubious_flags=model.origin_dubious_flags,
+            reasoning=model.reasoning,
+            verification_data=model.verification_data,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_verifications_inv_fact",
+            set_={
+                "status": stmt.excluded.status,
+                "original_confidence": stmt.excluded.original_confidence,
+                "confidence_boost": stmt.excluded.confidence_boost,
+                "final_confidence": stmt.excluded.final_confidence,
+                "search_count": stmt.excluded.search_count,
+                "supporting_evidence": stmt.excluded.supporting_evidence,
+                "refuting_evidence": stmt.excluded.refuting_evidence,
+                "queries_used": stmt.excluded.queries_used,
+                "origin_dubious_flags": stmt.excluded.origin_dubious_flags,
+                "reasoning": stmt.excluded.reasoning,
+                "verification_data": stmt.excluded.verification_data,
+                "updated_at": func.now(),
+            },
+        )
 
         async with self._session_factory() as session:
-            # Check if exists
-            existing = await session.execute(
-                select(VerificationModel.id).where(
-                    VerificationModel.investigation_id == inv_id,
-                    VerificationModel.fact_id == result.fact_id,
-                )
-            )
-            existing_id = existing.scalar_one_or_none()
-
-            if existing_id is not None:
-                # Update existing row
-                await session.execute(
-                    update(VerificationModel)
-                    .where(VerificationModel.id == existing_id)
-                    .values(
-                        status=record_data.get("status"),
-                        original_confidence=record_data.get("original_confidence"),
-                        confidence_boost=record_data.get("confidence_boost"),
-                        final_confidence=record_data.get("final_confidence"),
-                        search_count=record_data.get("query_attempts", 0),
-                        supporting_evidence=record_data.get("supporting_evidence", []),
-                        refuting_evidence=record_data.get("refuting_evidence", []),
-                        queries_used=record_data.get("queries_used", []),
-                        origin_dubious_flags=record_data.get("origin_dubious_flags", []),
-                        reasoning=record_data.get("reasoning"),
-                        verification_data=record_data,
-                    )
-                )
-            else:
-                model = VerificationModel.from_dict(record, inv_id)
-                session.add(model)
-
+            await session.execute(stmt)
             await session.commit()
 
         self._logger.debug(
@@ -186,6 +192,9 @@ class VerificationStore:
     ) -> list[VerificationResultRecord]:
         """Get results filtered by verification status.
 
+        Served by the ``(investigation_id, status)`` composite index, so
+        only the matching status bucket is read.
+
         Args:
             investigation_id: Investigation scope.
             status: VerificationStatus to filter by.
@@ -19,12 +19,20 @@ Usage:
 """
 
 import json
+import math
+import mmap
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from osint_system.data_management.classification_store import ClassificationStore
 from osint_system.data_management.fact_store import FactStore
 from osint_system.data_management.verification_store import VerificationStore
@@ -38,6 +46,53 @@ _SUPPORTED_VERSIONS = {"1.0"}
 _REQUIRED_KEYS = {"schema_version", "archive_type", "investigation_id", "data"}
 
 
+def _has_non_finite_float(value: Any) -> bool:
+    """Check whether a NaN or infinite float appears anywhere in value."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _orjson_dumps(archive: dict[str, Any]) -> bytes | None:
+    """Serialize an archive with orjson when it can do so losslessly.
+
+    orjson writes NaN and Infinity as null and cannot encode ints beyond
+    64 bits, where json.dump keeps both. Such archives are left to the
+    stdlib writer so nothing stored for reproducibility is lost.
+
+    Args:
+        archive: Archive dict to serialize.
+
+    Returns:
+        Indented JSON bytes, or None if the stdlib writer must be used.
+    """
+    if _has_non_finite_float(archive):
+        return None
+    try:
+        # Datetimes pass through to default=str so output matches the
+        # stdlib path; non-str keys are coerced like json.dump does.
+        return orjson.dumps(
+            archive,
+            default=str,
+            option=(
+                orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_PASSTHROUGH_DATETIME
+            ),
+        )
+    except orjson.JSONEncodeError:
+        return None
+
+
 class InvestigationArchive:
     """Produces self-contained JSON bundles for investigation reproducibility.
 
@@ -144,8 +199,12 @@ class InvestigationArchive:
             "statistics": statistics,
         }
 
-        with open(archive_path, "w", encoding="utf-8") as f:
-            json.dump(archive, f, indent=2, default=str)
+        payload = _orjson_dumps(archive) if ORJSON_AVAILABLE else None
+        if payload is not None:
+            archive_path.write_bytes(payload)
+        else:
+            with open(archive_path, "w", encoding="utf-8") as f:
+                json.dump(archive, f, indent=2, default=str)
 
         self._log.info(
             "archive_created",
@@ -161,7 +220,10 @@ class InvestigationArchive:
         """Load and validate an investigation archive from JSON.
 
         Reads the archive file, validates the schema version is
-        supported, and checks for required keys.
+        supported, and checks for required keys. The file is memory-mapped
+        so orjson (when installed) parses straight from the page cache
+        without an intermediate read buffer. Files orjson rejects, such as
+        stdlib-written archives containing NaN, are re-parsed with json.
 
         Args:
             archive_path: Path to the archive JSON file.
@@ -170,14 +232,26 @@ class InvestigationArchive:
             The complete archive dict.
 
         Raises:
-            ValueError: If schema_version is unsupported or required
-                        keys are missing.
+            ValueError: If the file is empty, schema_version is
+                        unsupported, or required keys are missing.
             FileNotFoundError: If the archive file does not exist.
         """
         archive_path = Path(archive_path)
 
-        with open(archive_path, "r", encoding="utf-8") as f:
-            archive = json.load(f)
+        with open(archive_path, "rb") as f:
+            if archive_path.stat().st_size == 0:
+                raise ValueError(f"Archive file is empty: {archive_path}")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if ORJSON_AVAILABLE:
+                    try:
+                        with memoryview(mm) as view:
+                            archive = orjson.loads(view)
+                    except orjson.JSONDecodeError:
+                        # Archives written by json.dump may hold NaN or
+                        # Infinity tokens, which only the stdlib accepts
+                        archive = json.loads(mm[:])
+                else:
+                    archive = json.loads(mm[:])
 
         # Validate required keys
         missing_keys = _REQUIRED_KEYS - set(archive.keys())
@@ -1,6 +1,6 @@
 """Signal analysis and coverage metrics for investigation refinement."""
 
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
@@ -38,17 +38,20 @@ def calculate_signal_strength(
     # Calculate component scores for each finding
     scores = []
     for finding in findings:
+        # Split the content once; entity and information density share it
+        words = finding.get("content", "").split()
+
         # Component 1: Keyword relevance (0.3 weight)
         keyword_score = _calculate_keyword_match(finding, keyword_set)
 
         # Component 2: Entity density (0.2 weight)
-        entity_score = _calculate_entity_density(finding)
+        entity_score = _calculate_entity_density(finding, words)
 
         # Component 3: Source credibility (0.3 weight)
         credibility_score = _get_credibility_score(finding)
 
         # Component 4: Information density (0.2 weight)
-        density_score = _calculate_information_density(finding)
+        density_score = _calculate_information_density(len(words))
 
         # Weighted combination
         finding_score = (
@@ -102,7 +105,7 @@ def _calculate_keyword_match(finding: Dict[str, Any], keywords: Set[str]) -> flo
     return min(match_ratio * 1.5, 1.0)
 
 
-def _calculate_entity_density(finding: Dict[str, Any]) -> float:
+def _calculate_entity_density(finding: Dict[str, Any], words: List[str]) -> float:
     """
     Calculate entity density score.
 
@@ -110,6 +113,7 @@ def _calculate_entity_density(finding: Dict[str, Any]) -> float:
 
     Args:
         finding: Finding dictionary with optional 'metadata.entities' field
+        words: The finding's content split on whitespace
 
     Returns:
         Entity density score 0.0-1.0
@@ -122,12 +126,10 @@ def _calculate_entity_density(finding: Dict[str, Any]) -> float:
         entity_count = len(entities)
     else:
         # Fallback: rough heuristic using capitalized words
-        content = finding.get("content", "")
-        words = content.split()
         entity_count = sum(1 for word in words if word and word[0].isupper() and len(word) > 1)
 
     # Normalize by content length
-    content_length = len(finding.get("content", "").split())
+    content_length = len(words)
     if content_length == 0:
         return 0.0
 
@@ -185,21 +187,18 @@ def _get_credibility_score(finding: Dict[str, Any]) -> float:
     return 0.6
 
 
-def _calculate_information_density(finding: Dict[str, Any]) -> float:
+def _calculate_information_density(word_count: int) -> float:
     """
     Calculate information density score.
 
     Longer, more detailed findings score higher.
 
     Args:
-        finding: Finding dictionary with 'content' field
+        word_count: Number of whitespace-separated words in the content
 
     Returns:
         Density score 0.0-1.0
     """
-    content = finding.get("content", "")
-    word_count = len(content.split())
-
     # Score based on content length
     if word_count < 20:
         return 0.3  # Very brief
@@ -262,19 +261,69 @@ class CoverageMetrics:
             self.covered_subtopics.update(topics)
 
         # Update temporal coverage
-        timestamp = finding.get("timestamp")
+        timestamp = self._parse_timestamp(finding.get("timestamp"))
         if timestamp:
-            if isinstance(timestamp, str):
-                try:
-                    timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                except ValueError:
-                    timestamp = None
+            self._extend_time_range(timestamp, timestamp)
+
+    def update_from_findings(self, findings: List[Dict[str, Any]]):
+        """
+        Update metrics from a batch of findings.
 
+        Same result as calling update_from_finding per finding, but the
+        time range is widened once from the batch's earliest and latest
+        timestamps instead of being compared per finding.
+
+        Args:
+            findings: Finding dictionaries with source, metadata fields
+        """
+        timestamps = []
+        for finding in findings:
+            source = finding.get("source")
+            if source:
+                self.unique_sources.add(source)
+
+            metadata = finding.get("metadata", {})
+            self.observed_locations.update(metadata.get("locations") or ())
+            self.covered_subtopics.update(metadata.get("topics") or ())
+
+            timestamp = self._parse_timestamp(finding.get("timestamp"))
             if timestamp:
-                if self.earliest_timestamp is None or timestamp < self.earliest_timestamp:
-                    self.earliest_timestamp = timestamp
-                if self.latest_timestamp is None or timestamp > self.latest_timestamp:
-                    self.latest_timestamp = timestamp
+                timestamps.append(timestamp)
+
+        if timestamps:
+            self._extend_time_range(min(timestamps), max(timestamps))
+
+    @staticmethod
+    def _parse_timestamp(timestamp: Any) -> Optional[datetime]:
+        """
+        Convert a finding timestamp to a datetime.
+
+        Args:
+            timestamp: datetime, ISO-8601 string (a trailing "Z" is accepted)
+                or None
+
+        Returns:
+            Parsed datetime, or None if missing or unparseable
+        """
+        if isinstance(timestamp, str):
+            try:
+                return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+        return timestamp or None
+
+    def _extend_time_range(self, earliest: datetime, latest: datetime):
+        """
+        Widen the observed time range to include [earliest, latest].
+
+        Args:
+            earliest: Earliest new timestamp
+            latest: Latest new timestamp
+        """
+        if self.earliest_timestamp is None or earliest < self.earliest_timestamp:
+            self.earliest_timestamp = earliest
+        if self.latest_timestamp is None or latest > self.latest_timestamp:
+            self.latest_timestamp = latest
 
     def get_source_diversity(self) -> float:
         """
@@ -420,17 +469,15 @@ def check_diminishing_returns(
     # Component 2: Entity/keyword novelty
     existing_entities = set()
     for f in existing_findings:
-        entities = f.get("metadata", {}).get("entities", [])
-        keywords = f.get("metadata", {}).get("keywords", [])
-        existing_entities.update(entities)
-        existing_entities.update(keywords)
+        metadata = f.get("metadata", {})
+        existing_entities.update(metadata.get("entities", []))
+        existing_entities.update(metadata.get("keywords", []))
 
     new_entities = set()
     for f in new_findings:
-        entities = f.get("metadata", {}).get("entities", [])
-        keywords = f.get("metadata", {}).get("keywords", [])
-        new_entities.update(entities)
-        new_entities.update(keywords)
+        metadata = f.get("metadata", {})
+        new_entities.update(metadata.get("entities", []))
+        new_entities.update(metadata.get("keywords", []))
 
     if new_entities:
         new_unique_entities = new_entities - existing_entities
@@ -491,9 +538,10 @@ def _calculate_content_novelty(
         words = content.split()
         total_new_words += len(words)
 
-        for word in words:
-            if word not in existing_words and len(word) > 3:  # Ignore short common words
-                novel_new_words += 1
+        # Ignore short common words
+        novel_new_words += sum(
+            1 for word in words if len(word) > 3 and word not in existing_words
+        )
 
     if total_new_words == 0:
         return 0.0
@@ -1,6 +1,7 @@
 """Iterative refinement engine for adaptive investigation strategies."""
 
 import json
+from collections.abc import Mapping
 from typing import Optional, Any
 from datetime import datetime
 from loguru import logger
@@ -140,7 +141,7 @@ class RefinementEngine:
 
         for finding in findings:
             # Extract metadata
-            if isinstance(finding, dict):
+            if isinstance(finding, Mapping):
                 source = finding.get("source", "unknown")
                 sources.add(source)
 
@@ -267,11 +268,11 @@ class RefinementEngine:
             recent_content = set()
 
             for f in early_findings:
-                if isinstance(f, dict) and "content" in f:
+                if isinstance(f, Mapping) and "content" in f:
                     early_content.add(f["content"][:50])  # First 50 chars as signature
 
             for f in recent_findings:
-                if isinstance(f, dict) and "content" in f:
+                if isinstance(f, Mapping) and "content" in f:
                     recent_content.add(f["content"][:50])
 
             if early_content and recent_content:
@@ -1,10 +1,13 @@
 """Task queue with priority-based task management and distribution."""
 
 import heapq
+import itertools
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Literal, Dict, List, Any
+from operator import attrgetter
+from typing import Optional, Literal, Dict, List, Any, Tuple
 from loguru import logger
 
 
@@ -64,8 +67,16 @@ class TaskQueue:
 
     def __init__(self):
         """Initialize the task queue."""
-        self._heap: List[Task] = []
+        # (-priority, insertion order, task_id) entries: tuples compare in C
+        # instead of through Task.__lt__, and the counter keeps FIFO order
+        # among equal priorities. Entries for tasks that are no longer
+        # pending are skipped lazily when popped.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
         self._tasks: Dict[str, Task] = {}  # task_id -> Task for O(1) lookup
+        # status -> task count, kept in step with every status change so
+        # get_statistics needs no scan over all tasks
+        self._status_counts: Counter = Counter()
         self._seen_sources: set = set()  # Track sources for diversity scoring
         self._investigation_keywords: set = set()  # Keywords from objective
         self.logger = logger.bind(component="TaskQueue")
@@ -127,9 +138,13 @@ class TaskQueue:
             status="pending"
         )
 
-        # Add to heap and lookup dict
-        heapq.heappush(self._heap, task)
+        # Add to heap and lookup dict (a reused ID replaces the old task)
+        heapq.heappush(self._heap, (-priority, next(self._counter), task_id))
+        replaced = self._tasks.get(task_id)
+        if replaced is not None:
+            self._status_counts[replaced.status] -= 1
         self._tasks[task_id] = task
+        self._status_counts["pending"] += 1
 
         # Update source diversity tracking
         source = metadata.get("source_type") if metadata else None
@@ -288,32 +303,40 @@ class TaskQueue:
         Returns:
             Task object if available, None if queue is empty
         """
-        while self._heap:
-            task = heapq.heappop(self._heap)
+        # Entries for tasks the agent cannot handle are set aside and pushed
+        # back afterwards; re-pushing inside the loop would pop them again
+        skipped = []
+        found = None
 
-            # Check if task still valid (not removed externally)
-            if task.id not in self._tasks:
-                continue
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            task = self._tasks.get(entry[2])
 
-            # Check if task still pending
-            if task.status != "pending":
+            # Skip tasks removed externally or no longer pending
+            if task is None or task.status != "pending":
                 continue
 
             # Check capability matching if specified
             if agent_capabilities:
                 required_capability = task.metadata.get("required_capability")
                 if required_capability and required_capability not in agent_capabilities:
-                    # Re-add to heap and continue
-                    heapq.heappush(self._heap, task)
+                    skipped.append(entry)
                     continue
 
-            # Update status
-            task.status = "assigned"
+            found = task
+            break
+
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
 
-            self.logger.info(f"Task retrieved: {task.id}", priority=f"{task.priority:.3f}")
-            return task
+        if found is None:
+            return None
 
-        return None
+        # Update status
+        self._set_status(found, "assigned")
+
+        self.logger.info(f"Task retrieved: {found.id}", priority=f"{found.priority:.3f}")
+        return found
 
     def update_task_status(
         self,
@@ -338,7 +361,7 @@ class TaskQueue:
 
         task = self._tasks[task_id]
         old_status = task.status
-        task.status = status
+        self._set_status(task, status)
 
         if assigned_agent:
             task.assigned_agent = assigned_agent
@@ -356,6 +379,18 @@ class TaskQueue:
 
         return True
 
+    def _set_status(self, task: Task, status: str) -> None:
+        """
+        Change a task's status and keep the status counts in step.
+
+        Args:
+            task: Task tracked by this queue
+            status: New status
+        """
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        task.status = status
+
     def get_pending_tasks(self, limit: Optional[int] = None) -> List[Task]:
         """
         Get all pending tasks sorted by priority.
@@ -371,11 +406,13 @@ class TaskQueue:
             if task.status == "pending"
         ]
 
-        # Sort by priority (descending) - use key to avoid __lt__ comparator
-        pending.sort(key=lambda t: t.priority, reverse=True)
-
+        # Sort by priority (descending) - use key to avoid __lt__ comparator.
+        # With a limit, a partial sort only orders the top `limit` tasks
+        # (nlargest keeps the same tie order as a full sort).
         if limit:
-            pending = pending[:limit]
+            pending = heapq.nlargest(limit, pending, key=attrgetter("priority"))
+        else:
+            pending.sort(key=attrgetter("priority"), reverse=True)
 
         self.logger.debug(f"Retrieved {len(pending)} pending tasks")
         return pending
@@ -399,9 +436,7 @@ class TaskQueue:
         Returns:
             Dictionary with queue metrics
         """
-        status_counts = {}
-        for task in self._tasks.values():
-            status_counts[task.status] = status_counts.get(task.status, 0) + 1
+        status_counts = self._status_counts
 
         return {
             "total_tasks": len(self._tasks),
@@ -418,6 +453,7 @@ class TaskQueue:
         """Clear all tasks from the queue."""
         self._heap.clear()
         self._tasks.clear()
+        self._status_counts.clear()
         self._seen_sources.clear()
         self.logger.info("Task queue cleared")
 
@@ -0,0 +1,95 @@
+"""Unit tests for MessageBus callback dispatch and drain()."""
+
+import asyncio
+
+import pytest
+from loguru import logger
+
+from osint_system.agents.communication.bus import MessageBus
+
+
+@pytest.fixture
+def bus():
+    """Fresh MessageBus singleton, reset after the test."""
+    MessageBus.reset_singleton()
+    yield MessageBus()
+    MessageBus.reset_singleton()
+
+
+@pytest.fixture
+def error_logs():
+    """Capture ERROR-level log messages emitted during the test."""
+    messages = []
+    handler_id = logger.add(messages.append, level="ERROR", format="{message}")
+    yield messages
+    logger.remove(handler_id)
+
+
+@pytest.mark.asyncio
+async def test_drain_delivers_in_publish_order(bus):
+    """A slow callback receives every message, in publish order."""
+    received = []
+
+    async def slow_callback(message):
+        # Earlier messages sleep longer, so unordered delivery would show
+        await asyncio.sleep(0.01 * (5 - message["payload"]))
+        received.append(message["payload"])
+
+    bus.subscribe_to_pattern("slow", "test.event", slow_callback)
+
+    for i in range(5):
+        await bus.publish("test.event", i)
+    await bus.drain()
+
+    assert received == [0, 1, 2, 3, 4]
+    assert not bus._pending_tasks
+
+
+@pytest.mark.asyncio
+async def test_callback_exception_is_logged_not_raised(bus, error_logs):
+    """A failing callback is logged and later messages are still delivered."""
+    received = []
+
+    async def flaky_callback(message):
+        if message["payload"] == 1:
+            raise ValueError("boom")
+        received.append(message["payload"])
+
+    bus.subscribe_to_pattern("flaky", "test.event", flaky_callback)
+
+    for i in range(3):
+        await bus.publish("test.event", i)
+    await bus.drain()
+
+    assert received == [0, 2]
+    assert any(
+        "Subscriber flaky callback error: boom" in str(m) for m in error_logs
+    )
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_messages_published_by_callbacks(bus):
+    """drain() also awaits callbacks scheduled by other callbacks."""
+    received = []
+
+    async def relay(message):
+        await asyncio.sleep(0.01)
+        await bus.publish("test.relayed", message["payload"])
+
+    async def sink(message):
+        await asyncio.sleep(0.01)
+        received.append(message["payload"])
+
+    bus.subscribe_to_pattern("relay", "test.event", relay)
+    bus.subscribe_to_pattern("sink", "test.relayed", sink)
+
+    await bus.publish("test.event", "hello")
+    await bus.drain()
+
+    assert received == ["hello"]
+
+
+@pytest.mark.asyncio
+async def test_drain_returns_when_nothing_pending(bus):
+    """drain() with no outstanding callbacks returns immediately."""
+    await asyncio.wait_for(bus.drain(), timeout=1.0)
@@ -231,6 +231,24 @@ class TestTransparencyMethods:
         assert "signal_strength" in status["routing_thresholds"]
         assert "coverage_targets" in status["routing_thresholds"]
 
+    def test_reset_clears_investigation_state(self):
+        """Test that reset drops per-investigation state but keeps config."""
+        orchestrator = PlanningOrchestrator(registry=None, message_bus=None, max_refinements=5)
+        graph = orchestrator.graph
+
+        orchestrator.track_conflict({"topic": "Timeline"})
+        orchestrator.previous_findings = [{"content": "old"}]
+        orchestrator.refinement_engine.refinement_history.append({"iteration": 1})
+
+        orchestrator.reset()
+
+        assert orchestrator.get_conflict_report() == []
+        assert orchestrator.previous_findings == []
+        assert orchestrator.coverage_metrics is None
+        assert orchestrator.refinement_engine.refinement_history == []
+        assert orchestrator.refinement_engine.max_iterations == 5
+        assert orchestrator.graph is graph
+
     def test_explain_routing(self):
         """Test routing explanation generation."""
         orchestrator = PlanningOrchestrator(registry=None, message_bus=None)
@@ -0,0 +1,81 @@
+"""Suite-wide pytest configuration.
+
+Async tests share one session-scoped event loop (see
+``[tool.pytest.ini_options]`` in pyproject.toml) instead of paying for a
+fresh loop per test. uvloop comes with the dev dependency group, so the
+shared loop is a uvloop loop; on Windows, where uvloop is unavailable,
+the stdlib policy is used unchanged.
+
+PostgreSQL-backed stores get their session factory from the
+``pg_session_factory`` fixture. It connects with
+``DatabaseConfig.from_env()`` (the docker-compose defaults) to a database
+migrated with ``alembic upgrade head``; point ``POSTGRES_DB`` at a
+disposable database, since the store tests write and delete their own
+investigations. Tests that request it are skipped when no server is
+reachable. Those that write rows also take ``pg_test_lock``, so xdist
+workers never clear each other's investigations mid-test.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from osint_system.config.database_config import DatabaseConfig
+from osint_system.data_management.database import (
+    create_engine,
+    create_session_factory,
+)
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Advisory lock key serializing database-writing tests across xdist workers
+_PG_TEST_LOCK_KEY = 5_147_001
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop's policy for the shared test loop when available."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.EventLoopPolicy()
+    return asyncio.get_event_loop_policy()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def pg_session_factory():
+    """Session factory for the test PostgreSQL database, or skip."""
+    config = DatabaseConfig.from_env()
+    engine = create_engine(config)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, SQLAlchemyError) as e:
+        await engine.dispose()
+        pytest.skip(
+            f"PostgreSQL unavailable at "
+            f"{config.postgres_host}:{config.postgres_port}: {e}"
+        )
+
+    yield create_session_factory(engine)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def pg_test_lock(pg_session_factory):
+    """Hold a PostgreSQL advisory lock for the duration of one test."""
+    async with pg_session_factory() as session:
+        await session.execute(
+            text("SELECT pg_advisory_lock(:key)"), {"key": _PG_TEST_LOCK_KEY}
+        )
+        try:
+            yield
+        finally:
+            await session.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": _PG_TEST_LOCK_KEY}
+            )
@@ -0,0 +1,178 @@
+"""Unit tests for ArticleStore batching over a mocked AsyncSession.
+
+These run without PostgreSQL: the session records each statement and
+answers the lookups save_articles and get_investigation_stats issue. The
+end-to-end behaviour against a real database is covered by the
+ArticleStore tests in tests/integration/test_crawler_integration.py.
+"""
+
+import hashlib
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+
+from osint_system.data_management import article_store as article_store_module
+from osint_system.data_management.article_store import ArticleStore
+
+
+def _article(url: str, title: str, source: str = "Wire") -> dict:
+    """Build a minimal crawled article dict."""
+    return {
+        "title": title,
+        "url": url,
+        "content": f"{title} content",
+        "published_date": "2024-01-01T00:00:00+00:00",
+        "source": {"name": source},
+        "metadata": {},
+    }
+
+
+def _article_id(url: str) -> str:
+    """ArticleModel's article_id for a URL (SHA256 of the URL)."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _upsert_rows(stmt: Insert) -> list[dict]:
+    """Decode the rows of a multi-row INSERT from its bound parameters."""
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    rows: dict[int, dict] = {}
+    for key, value in params.items():
+        match = re.fullmatch(r"(\w+)_m(\d+)", key)
+        if match:
+            rows.setdefault(int(match.group(2)), {})[match.group(1)] = value
+        else:
+            rows.setdefault(0, {})[key] = value
+    return [rows[i] for i in sorted(rows)]
+
+
+def _mock_store(existing_ids=(), total=0, source_rows=()):
+    """ArticleStore over a mocked session that records executed statements.
+
+    Args:
+        existing_ids: article_ids the pre-check reports as already stored.
+        total: Value returned by the per-investigation COUNT query.
+        source_rows: (source_name, count) rows for the GROUP BY query.
+
+    Returns:
+        Tuple of (store, list of executed upsert statements).
+    """
+    upserts = []
+
+    async def execute(stmt):
+        result = MagicMock()
+        if isinstance(stmt, Insert):
+            upserts.append(stmt)
+        else:
+            result.scalars.return_value = iter(existing_ids)
+            result.scalar.return_value = total
+            result.all.return_value = [
+                SimpleNamespace(source_name=name, cnt=cnt) for name, cnt in source_rows
+            ]
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = session
+
+    return ArticleStore(session_factory=session_factory), upserts
+
+
+class TestSaveArticlesBatching:
+    """Tests for the batched pre-check and multi-row upserts."""
+
+    @pytest.mark.asyncio
+    async def test_counts_with_in_batch_duplicate_and_existing_url(self):
+        """Existing URLs and in-batch repeats count as updated, not saved."""
+        existing_url = "https://example.com/existing"
+        new_url = "https://example.com/new"
+        store, upserts = _mock_store(existing_ids=[_article_id(existing_url)], total=2)
+
+        stats = await store.save_articles(
+            "inv-1",
+            [
+                _article(existing_url, "Existing, refreshed"),
+                _article(new_url, "New, first copy"),
+                _article(new_url, "New, second copy"),
+            ],
+        )
+
+        assert stats == {"saved": 1, "updated": 2, "duplicates": 0, "total": 2}
+
+        # One statement; the repeated URL collapses to its last occurrence
+        assert len(upserts) == 1
+        rows = _upsert_rows(upserts[0])
+        assert [row["url"] for row in rows] == [existing_url, new_url]
+        assert rows[1]["title"] == "New, second copy"
+
+    @pytest.mark.asyncio
+    async def test_articles_without_url_are_skipped(self):
+        """Articles with no URL are neither counted nor written."""
+        store, upserts = _mock_store(total=1)
+
+        stats = await store.save_articles(
+            "inv-1",
+            [_article("", "No URL"), _article("https://example.com/a", "A")],
+        )
+
+        assert stats["saved"] == 1
+        assert stats["updated"] == 0
+        assert len(_upsert_rows(upserts[0])) == 1
+
+    @pytest.mark.asyncio
+    async def test_upserts_are_chunked(self, monkeypatch):
+        """Batches larger than the chunk size are split across statements."""
+        monkeypatch.setattr(article_store_module, "_UPSERT_BATCH_SIZE", 2)
+        store, upserts = _mock_store(total=5)
+
+        stats = await store.save_articles(
+            "inv-1",
+            [_article(f"https://example.com/{i}", f"Article {i}") for i in range(5)],
+        )
+
+        assert stats["saved"] == 5
+        assert [len(_upsert_rows(stmt)) for stmt in upserts] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_issues_no_upsert(self):
+        """An empty batch writes nothing."""
+        store, upserts = _mock_store()
+
+        stats = await store.save_articles("inv-1", [])
+
+        assert stats == {"saved": 0, "updated": 0, "duplicates": 0, "total": 0}
+        assert upserts == []
+
+
+class TestInvestigationStats:
+    """Tests for the grouped source breakdown."""
+
+    @pytest.mark.asyncio
+    async def test_source_breakdown_folds_missing_names_into_unknown(self):
+        """NULL and empty source names are both reported as Unknown."""
+        store, _ = _mock_store(
+            source_rows=[("Source A", 3), ("Source B", 2), (None, 1), ("", 4)]
+        )
+
+        stats = await store.get_investigation_stats("inv-1")
+
+        assert stats["exists"] is True
+        assert stats["total_articles"] == 10
+        assert stats["source_breakdown"] == {
+            "Source A": 3,
+            "Source B": 2,
+            "Unknown": 5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_investigation(self):
+        """No grouped rows means the investigation does not exist."""
+        store, _ = _mock_store()
+
+        stats = await store.get_investigation_stats("inv-missing")
+
+        assert stats == {"exists": False, "investigation_id": "inv-missing"}
@@ -10,26 +10,40 @@ Tests cover:
 7. Statistics calculation
 8. Persistence (save/load cycle)
 9. Delete investigation
+10. Batched save and SQL aggregates over a mocked session
+
+All but the mocked-session tests need PostgreSQL (see pg_session_factory).
 """
 
 import asyncio
 import json
-import tempfile
-from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from osint_system.data_management.fact_store import FactStore
+from osint_system.data_management.models.fact import FactModel
+
+# Investigations written by these tests; cleared before and after each test
+_TEST_INVESTIGATIONS = ("inv-001", "inv-002")
+
+
+@pytest_asyncio.fixture
+async def store(pg_test_lock, pg_session_factory):
+    """FactStore on the test database with the test investigations cleared."""
+    fact_store = FactStore(session_factory=pg_session_factory)
+    for investigation_id in _TEST_INVESTIGATIONS:
+        await fact_store.delete_investigation(investigation_id)
+    yield fact_store
+    for investigation_id in _TEST_INVESTIGATIONS:
+        await fact_store.delete_investigation(investigation_id)
 
 
 class TestFactStoreSaveAndRetrieve:
     """Tests for basic save and retrieve operations."""
 
-    @pytest.fixture
-    def store(self):
-        """Create a fresh FactStore for each test."""
-        return FactStore()
-
     @pytest.fixture
     def sample_fact(self):
         """Create a sample fact dict."""
@@ -42,7 +56,7 @@ class TestFactStoreSaveAndRetrieve:
         }
 
     @pytest.mark.asyncio
-    async def test_save_single_fact(self, store, sample_fact):
+    async def test_save_single_fact(self, sample_fact, store):
         """Save and retrieve a single fact."""
         stats = await store.save_facts("inv-001", [sample_fact])
 
@@ -51,7 +65,7 @@ class TestFactStoreSaveAndRetrieve:
         assert stats["total"] == 1
 
     @pytest.mark.asyncio
-    async def test_retrieve_saved_fact(self, store, sample_fact):
+    async def test_retrieve_saved_fact(self, sample_fact, store):
         """Retrieved fact matches saved fact."""
         await store.save_facts("inv-001", [sample_fact])
         fact = await store.get_fact("inv-001", "f-001")
@@ -68,7 +82,7 @@ class TestFactStoreSaveAndRetrieve:
         assert fact is None
 
     @pytest.mark.asyncio
-    async def test_retrieve_by_investigation(self, store, sample_fact):
+    async def test_retrieve_by_investigation(self, sample_fact, store):
         """Retrieve all facts for an investigation."""
         await store.save_facts("inv-001", [sample_fact])
         result = await store.retrieve_by_investigation("inv-001")
@@ -82,10 +96,6 @@ class TestFactStoreSaveAndRetrieve:
 class TestFactStoreO1Lookup:
     """Tests for O(1) index-based lookups."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_lookup_by_fact_id(self, store):
         """O(1) lookup by fact_id."""
@@ -127,10 +137,6 @@ class TestFactStoreO1Lookup:
 class TestFactStoreDuplicateHandling:
     """Tests for duplicate detection and variant linking."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_same_hash_links_variants(self, store):
         """Same content_hash links facts as variants."""
@@ -190,13 +196,33 @@ class TestFactStoreDuplicateHandling:
             assert f"f-{i}" in canonical["variants"]
 
 
+    @pytest.mark.asyncio
+    async def test_same_hash_links_to_stored_canonical(self, store):
+        """A later batch links same-hash facts to the canonical already stored."""
+        await store.save_facts(
+            "inv-001",
+            [{"fact_id": "f-001", "content_hash": "same-hash", "claim": {"text": "Same"}}],
+        )
+        stats = await store.save_facts(
+            "inv-001",
+            [
+                {"fact_id": "f-002", "content_hash": "same-hash", "claim": {"text": "Same"}},
+                {"fact_id": "f-003", "content_hash": "same-hash", "claim": {"text": "Same"}},
+            ],
+        )
+
+        assert stats["saved"] == 2
+        assert stats["updated"] == 2
+
+        canonical = await store.get_fact("inv-001", "f-001")
+        assert canonical["variants"] == ["f-002", "f-003"]
+        variant = await store.get_fact("inv-001", "f-003")
+        assert variant["variants"] == ["f-001"]
+
+
 class TestFactStoreSourceIndexing:
     """Tests for source-based queries."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_get_facts_by_source(self, store):
         """Retrieve facts by source_id."""
@@ -240,10 +266,6 @@ class TestFactStoreSourceIndexing:
 class TestFactStoreInvestigationScoping:
     """Tests for investigation-level isolation."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_same_fact_different_investigations(self, store):
         """Same fact_id can exist in different investigations."""
@@ -288,10 +310,6 @@ class TestFactStoreInvestigationScoping:
 class TestFactStoreStatistics:
     """Tests for statistics calculation."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_investigation_stats(self, store):
         """Get statistics for an investigation."""
@@ -324,6 +342,7 @@ class TestFactStoreStatistics:
     @pytest.mark.asyncio
     async def test_storage_stats(self, store):
         """Get overall storage statistics."""
+        before = await store.get_storage_stats()
         facts1 = [{"fact_id": f"f1-{i}", "content_hash": f"h1-{i}", "claim": {"text": f"C{i}"}}
                   for i in range(5)]
         facts2 = [{"fact_id": f"f2-{i}", "content_hash": f"h2-{i}", "claim": {"text": f"D{i}"}}
@@ -334,66 +353,51 @@ class TestFactStoreStatistics:
 
         stats = await store.get_storage_stats()
 
-        assert stats["total_investigations"] == 2
-        assert stats["total_facts"] == 8
-        assert stats["indexed_fact_ids"] == 8
-        assert stats["indexed_hashes"] == 8
+        assert stats["total_investigations"] - before["total_investigations"] == 2
+        assert stats["total_facts"] - before["total_facts"] == 8
+        assert stats["indexed_fact_ids"] - before["indexed_fact_ids"] == 8
+        assert stats["indexed_hashes"] - before["indexed_hashes"] == 8
 
 
 class TestFactStorePersistence:
-    """Tests for JSON file persistence."""
-
-    @pytest.mark.asyncio
-    async def test_save_and_load(self):
-        """Persistence save/load cycle preserves data."""
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            persistence_path = f.name
-
-        try:
-            # Create store and save facts
-            store1 = FactStore(persistence_path=persistence_path)
-            facts = [
-                {"fact_id": "f-001", "content_hash": "h1", "claim": {"text": "Test claim"},
-                 "provenance": {"source_id": "s1"}},
-                {"fact_id": "f-002", "content_hash": "h1", "claim": {"text": "Test claim"},
-                 "provenance": {"source_id": "s2"}},  # variant
-            ]
-            await store1.save_facts("inv-001", facts)
-
-            # Create new store from same file
-            store2 = FactStore(persistence_path=persistence_path)
-
-            # Verify data loaded
-            fact = await store2.get_fact("inv-001", "f-001")
-            assert fact is not None
-            assert fact["content_hash"] == "h1"
-            assert "f-002" in fact["variants"]
-
-            # Verify indexes rebuilt
-            hash_facts = await store2.get_facts_by_hash("h1")
-            assert len(hash_facts) == 2
-
-        finally:
-            Path(persistence_path).unlink(missing_ok=True)
-
-    @pytest.mark.asyncio
-    async def test_persistence_disabled(self):
-        """Store works without persistence path."""
-        store = FactStore()  # No persistence_path
-        fact = {"fact_id": "f-001", "content_hash": "h1", "claim": {"text": "Test"}}
-        await store.save_facts("inv-001", [fact])
+    """Tests for PostgreSQL persistence across store instances."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_load(self, store, pg_session_factory):
+        """A new store on the same database sees saved facts and variants."""
+        facts = [
+            {"fact_id": "f-001", "content_hash": "h1", "claim": {"text": "Test claim"},
+             "provenance": {"source_id": "s1"}},
+            {"fact_id": "f-002", "content_hash": "h1", "claim": {"text": "Test claim"},
+             "provenance": {"source_id": "s2"}},  # variant
+        ]
+        await store.save_facts("inv-001", facts)
 
-        retrieved = await store.get_fact("inv-001", "f-001")
-        assert retrieved is not None
+        # Create new store on the same database
+        store2 = FactStore(session_factory=pg_session_factory)
+
+        # Verify data loaded
+        fact = await store2.get_fact("inv-001", "f-001")
+        assert fact is not None
+        assert fact["content_hash"] == "h1"
+        assert "f-002" in fact["variants"]
+
+        # Verify hash lookups
+        hash_facts = await store2.get_facts_by_hash("h1", investigation_id="inv-001")
+        assert len(hash_facts) == 2
+
+    @pytest.mark.asyncio
+    async def test_storage_stats_report_postgresql(self, store):
+        """Storage stats report PostgreSQL as the persistence backend."""
+        stats = await store.get_storage_stats()
+
+        assert stats["persistence_enabled"] is True
+        assert stats["persistence_path"] == "PostgreSQL"
 
 
 class TestFactStoreDelete:
     """Tests for deletion operations."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_delete_investigation(self, store):
         """Delete investigation removes all facts."""
@@ -405,8 +409,8 @@ class TestFactStoreDelete:
 
         assert result is True
         assert await store.get_fact("inv-001", "f-0") is None
-        stats = await store.get_storage_stats()
-        assert stats["total_facts"] == 0
+        remaining = await store.retrieve_by_investigation("inv-001")
+        assert remaining["total_facts"] == 0
 
     @pytest.mark.asyncio
     async def test_delete_nonexistent(self, store):
@@ -433,10 +437,6 @@ class TestFactStoreDelete:
 class TestFactStoreVariantLinking:
     """Tests for explicit variant linking."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_link_variants(self, store):
         """Explicitly link facts as variants."""
@@ -478,10 +478,6 @@ class TestFactStoreVariantLinking:
 class TestFactStoreListInvestigations:
     """Tests for listing investigations."""
 
-    @pytest.fixture
-    def store(self):
-        return FactStore()
-
     @pytest.mark.asyncio
     async def test_list_investigations(self, store):
         """List all investigations."""
@@ -490,13 +486,140 @@ class TestFactStoreListInvestigations:
 
         investigations = await store.list_investigations()
 
-        assert len(investigations) == 2
         inv_ids = {inv["investigation_id"] for inv in investigations}
         assert "inv-001" in inv_ids
         assert "inv-002" in inv_ids
 
     @pytest.mark.asyncio
     async def test_list_empty(self, store):
-        """List returns empty when no investigations."""
+        """List has no entry for an investigation without facts."""
         investigations = await store.list_investigations()
-        assert len(investigations) == 0
+        inv_ids = {inv["investigation_id"] for inv in investigations}
+        assert "inv-001" not in inv_ids
+
+
+# ── Batched save and SQL aggregates over a mocked session ─────────────────
+
+
+def _mock_fact_store(existing_ids=(), stored_rows=(), summary=None, source_rows=()):
+    """FactStore over a mocked session that answers each query by its columns.
+
+    Args:
+        existing_ids: fact_ids the batched pre-check reports as stored.
+        stored_rows: FactModel rows returned by the content-hash lookup.
+        summary: (total, unique_claims, with_variants) for get_stats.
+        source_rows: (source_url, count) rows for the source breakdown.
+
+    Returns:
+        Tuple of (store, list of models added to the session).
+    """
+    added = []
+
+    async def execute(stmt):
+        first_column = stmt.column_descriptions[0]["name"]
+        result = MagicMock()
+        if first_column == "fact_id":
+            result.scalars.return_value = iter(existing_ids)
+        elif first_column == "FactModel":
+            result.scalars.return_value = iter(stored_rows)
+        elif first_column == "total":
+            total, unique_claims, with_variants = summary
+            result.one.return_value = SimpleNamespace(
+                total=total, unique_claims=unique_claims, with_variants=with_variants
+            )
+        elif first_column == "source_url":
+            result.all.return_value = list(source_rows)
+        else:  # per-investigation COUNT
+            result.scalar.return_value = len(added)
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.add = added.append
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = session
+
+    return FactStore(session_factory=session_factory), added
+
+
+class TestFactStoreBatchedSave:
+    """Tests for save_facts batching and get_stats without PostgreSQL."""
+
+    @pytest.mark.asyncio
+    async def test_variants_linked_within_batch(self):
+        """The first fact of a hash in the batch is canonical for the rest."""
+        store, added = _mock_fact_store()
+        facts = [
+            {"fact_id": f"f-{i}", "content_hash": "same-hash", "claim": {"text": "Same"}}
+            for i in range(3)
+        ]
+
+        stats = await store.save_facts("inv-001", facts)
+
+        assert stats == {"saved": 3, "updated": 2, "skipped": 0, "total": 3}
+        by_id = {model.fact_id: model for model in added}
+        assert by_id["f-0"].variants == ["f-1", "f-2"]
+        assert by_id["f-1"].variants == ["f-0"]
+        assert by_id["f-2"].variants == ["f-0"]
+
+    @pytest.mark.asyncio
+    async def test_variants_linked_to_stored_canonical(self):
+        """Same-hash facts link to the canonical fact already in the store."""
+        canonical = FactModel.from_dict(
+            {"fact_id": "f-old", "content_hash": "same-hash", "claim": {"text": "Same"},
+             "variants": []},
+            "inv-001",
+        )
+        store, added = _mock_fact_store(stored_rows=[canonical])
+        facts = [
+            {"fact_id": "f-new-1", "content_hash": "same-hash", "claim": {"text": "Same"}},
+            {"fact_id": "f-new-2", "content_hash": "same-hash", "claim": {"text": "Same"}},
+        ]
+
+        stats = await store.save_facts("inv-001", facts)
+
+        assert stats["saved"] == 2
+        assert stats["updated"] == 2
+        assert canonical.variants == ["f-new-1", "f-new-2"]
+        assert [model.variants for model in added] == [["f-old"], ["f-old"]]
+
+    @pytest.mark.asyncio
+    async def test_stored_and_repeated_fact_ids_skipped(self):
+        """fact_ids already stored or repeated in the batch are skipped."""
+        store, added = _mock_fact_store(existing_ids=["f-stored"])
+        facts = [
+            {"fact_id": "f-stored", "content_hash": "h1", "claim": {"text": "C1"}},
+            {"fact_id": "f-new", "content_hash": "h2", "claim": {"text": "C2"}},
+            {"fact_id": "f-new", "content_hash": "h2", "claim": {"text": "C2"}},
+            {"content_hash": "h3", "claim": {"text": "No id"}},
+        ]
+
+        stats = await store.save_facts("inv-001", facts)
+
+        assert stats["saved"] == 1
+        assert stats["skipped"] == 3
+        assert [model.fact_id for model in added] == ["f-new"]
+
+    @pytest.mark.asyncio
+    async def test_stats_source_breakdown(self):
+        """get_stats reports the SQL aggregates and grouped source counts."""
+        store, _ = _mock_fact_store(
+            summary=(3, 2, 2), source_rows=[("source-A", 2), ("source-B", 1)]
+        )
+
+        stats = await store.get_stats("inv-001")
+
+        assert stats["exists"] is True
+        assert stats["total_facts"] == 3
+        assert stats["unique_claims"] == 2
+        assert stats["facts_with_variants"] == 2
+        assert stats["source_breakdown"] == {"source-A": 2, "source-B": 1}
+
+    @pytest.mark.asyncio
+    async def test_stats_for_empty_investigation(self):
+        """A zero total short-circuits before the source breakdown query."""
+        store, _ = _mock_fact_store(summary=(0, 0, 0))
+
+        stats = await store.get_stats("inv-001")
+
+        assert stats == {"exists": False, "investigation_id": "inv-001"}
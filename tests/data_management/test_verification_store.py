@@ -19,6 +19,11 @@ from osint_system.data_management.schemas.verification_schema import (
 from osint_system.data_management.verification_store import VerificationStore
 
 
+_CONFIRMED = VerificationStatus.CONFIRMED
+_REFUTED = VerificationStatus.REFUTED
+_PHANTOM_FLAGS = (DubiousFlag.PHANTOM,)
+
+
 # ── Fixtures ──────────────────────────────────────────────────────────────
 
 
@@ -27,12 +32,16 @@ def store() -> VerificationStore:
     return VerificationStore()
 
 
-@pytest.fixture
-def confirmed_result() -> VerificationResult:
+# Templates are validated once per module; per-test fixtures hand out
+# shallow model_copy() clones so no test pays for re-validation.
+
+
+@pytest.fixture(scope="module")
+def _confirmed_template() -> VerificationResult:
     return VerificationResult(
         fact_id="fact-001",
         investigation_id="inv-1",
-        status=VerificationStatus.CONFIRMED,
+        status=_CONFIRMED,
         original_confidence=0.4,
         confidence_boost=0.3,
         final_confidence=0.7,
@@ -47,17 +56,17 @@ def confirmed_result() -> VerificationResult:
                 relevance_score=0.95,
             )
         ],
-        origin_dubious_flags=[DubiousFlag.PHANTOM],
+        origin_dubious_flags=list(_PHANTOM_FLAGS),
         reasoning="Wire service confirms",
     )
 
 
-@pytest.fixture
-def refuted_result() -> VerificationResult:
+@pytest.fixture(scope="module")
+def _refuted_template() -> VerificationResult:
     return VerificationResult(
         fact_id="fact-002",
         investigation_id="inv-1",
-        status=VerificationStatus.REFUTED,
+        status=_REFUTED,
         original_confidence=0.5,
         confidence_boost=0.0,
         final_confidence=0.5,
@@ -65,18 +74,33 @@ def refuted_result() -> VerificationResult:
     )
 
 
-@pytest.fixture
-def critical_review_result() -> VerificationResult:
-    result = VerificationResult(
+@pytest.fixture(scope="module")
+def _critical_review_template() -> VerificationResult:
+    return VerificationResult(
         fact_id="fact-003",
         investigation_id="inv-1",
-        status=VerificationStatus.CONFIRMED,
+        status=_CONFIRMED,
         original_confidence=0.6,
         confidence_boost=0.3,
         reasoning="Critical fact confirmed",
-    )
-    result.requires_human_review = True
-    return result
+    ).model_copy(update={"requires_human_review": True})
+
+
+@pytest.fixture
+def confirmed_result(_confirmed_template: VerificationResult) -> VerificationResult:
+    return _confirmed_template.model_copy()
+
+
+@pytest.fixture
+def refuted_result(_refuted_template: VerificationResult) -> VerificationResult:
+    return _refuted_template.model_copy()
+
+
+@pytest.fixture
+def critical_review_result(
+    _critical_review_template: VerificationResult,
+) -> VerificationResult:
+    return _critical_review_template.model_copy()
 
 
 # ── Save and Retrieve Tests ──────────────────────────────────────────────
@@ -6,7 +6,10 @@ load/validate capability.
 """
 
 import json
+import math
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 import pytest_asyncio
@@ -23,6 +26,7 @@ from osint_system.data_management.schemas.verification_schema import (
     VerificationStatus,
 )
 from osint_system.data_management.verification_store import VerificationStore
+from osint_system.database import archive as archive_module
 from osint_system.database.archive import InvestigationArchive
 
 INVESTIGATION_ID = "inv-archive-test"
@@ -297,3 +301,99 @@ async def test_archive_empty_investigation(archive):
     assert data["statistics"]["confirmed_count"] == 0
     assert data["statistics"]["refuted_count"] == 0
     assert data["statistics"]["dubious_count"] == 0
+
+
+def _stub_archive(facts: list[dict], tmp_path: Path) -> InvestigationArchive:
+    """Create InvestigationArchive over in-memory stand-ins for the stores."""
+    return InvestigationArchive(
+        fact_store=SimpleNamespace(
+            retrieve_by_investigation=AsyncMock(
+                return_value={"facts": facts, "metadata": {"objective": "Summit"}}
+            )
+        ),
+        classification_store=SimpleNamespace(
+            get_all_classifications=AsyncMock(return_value=[])
+        ),
+        verification_store=SimpleNamespace(
+            get_all_results=AsyncMock(return_value=_make_test_verifications())
+        ),
+        output_dir=str(tmp_path),
+    )
+
+
+@pytest.mark.asyncio
+async def test_archive_roundtrip_orjson_and_stdlib(monkeypatch, tmp_path):
+    """Both writer branches round-trip the same archive."""
+    pytest.importorskip("orjson")
+
+    facts = _make_test_facts()
+    facts[0]["claim"]["text"] = "Zelenskyy met Erdoğan in Kyiv — Київ"
+    archive = _stub_archive(facts, tmp_path)
+
+    loaded = {}
+    raw = {}
+    for use_orjson in (True, False):
+        monkeypatch.setattr(archive_module, "ORJSON_AVAILABLE", use_orjson)
+        path = await archive.create_archive(
+            INVESTIGATION_ID, output_path=str(tmp_path / f"orjson_{use_orjson}.json")
+        )
+        raw[use_orjson] = path.read_bytes()
+        loaded[use_orjson] = await InvestigationArchive.load_archive(path)
+
+    assert loaded[True]["data"]["facts"] == facts
+    assert loaded[False]["data"]["facts"] == facts
+    assert (
+        loaded[True]["data"]["verification_results"]
+        == loaded[False]["data"]["verification_results"]
+    )
+    assert loaded[True]["statistics"] == loaded[False]["statistics"]
+
+    # orjson writes raw UTF-8; json.dump escapes non-ASCII by default
+    assert "Київ".encode() in raw[True]
+    assert b"\\u041a" in raw[False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "value",
+    [float("nan"), float("inf"), -float("inf"), 2**70, -(2**64)],
+    ids=["nan", "inf", "-inf", "int-over-64-bits", "int-under-64-bits"],
+)
+async def test_archive_keeps_values_orjson_cannot_encode(monkeypatch, tmp_path, value):
+    """Non-finite floats and ints beyond 64 bits survive the orjson writer."""
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(archive_module, "ORJSON_AVAILABLE", True)
+
+    facts = _make_test_facts()
+    facts[1]["quality"]["claim_clarity"] = value
+    archive = _stub_archive(facts, tmp_path)
+
+    path = await archive.create_archive(INVESTIGATION_ID)
+    loaded = await InvestigationArchive.load_archive(path)
+
+    stored = loaded["data"]["facts"][1]["quality"]["claim_clarity"]
+    if isinstance(value, float) and math.isnan(value):
+        assert math.isnan(stored)
+    else:
+        assert stored == value
+    assert loaded["data"]["facts"][0] == facts[0]
+
+
+@pytest.mark.asyncio
+async def test_load_stdlib_archive_with_nan_under_orjson(monkeypatch, tmp_path):
+    """Archives json.dump wrote with NaN still load when orjson is installed."""
+    pytest.importorskip("orjson")
+
+    facts = _make_test_facts()
+    facts[1]["quality"]["claim_clarity"] = float("nan")
+    archive = _stub_archive(facts, tmp_path)
+
+    monkeypatch.setattr(archive_module, "ORJSON_AVAILABLE", False)
+    path = await archive.create_archive(INVESTIGATION_ID)
+    assert b"NaN" in path.read_bytes()
+
+    monkeypatch.setattr(archive_module, "ORJSON_AVAILABLE", True)
+    loaded = await InvestigationArchive.load_archive(path)
+
+    assert math.isnan(loaded["data"]["facts"][1]["quality"]["claim_clarity"])
+    assert loaded["data"]["facts"][0] == facts[0]
@@ -11,8 +11,10 @@ Tests the complete flow:
 
 import asyncio
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
+from types import MappingProxyType
 
 from osint_system.agents.planning_agent import PlanningOrchestrator
 from osint_system.agents.crawlers.newsfeed_agent import NewsFeedAgent
@@ -21,19 +23,104 @@ from osint_system.agents.communication.bus import MessageBus
 from osint_system.agents.registry import AgentRegistry
 
 
+_FIXED_TS = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+
+# Mock RSS and API results, shared so fetch mocks avoid external calls
+_MOCK_ARTICLES = (
+    MappingProxyType({
+        "title": "Test Article 1",
+        "url": "https://example.com/article1",
+        "content": "Test content about Ukraine politics",
+        "published_date": _FIXED_TS,
+        "source": {"name": "MockNews", "type": "rss"},
+        "metadata": {"test": True}
+    }),
+    MappingProxyType({
+        "title": "Test Article 2",
+        "url": "https://example.com/article2",
+        "content": "More test content about Ukraine",
+        "published_date": _FIXED_TS,
+        "source": {"name": "MockAPI", "type": "api"},
+        "metadata": {"test": True}
+    }),
+)
+
+# Planning state with a single news-related subtask; copy with a fresh
+# "messages" list before handing to assign_agents, which extends it.
+_NEWS_STATE = MappingProxyType({
+    "objective": "Investigate recent political developments in Ukraine",
+    "subtasks": (
+        MappingProxyType({
+            "id": "ST-001",
+            "description": "Find recent news articles about Ukraine",
+            "priority": 9,
+            "suggested_sources": ("news",),
+            "status": "pending"
+        }),
+    ),
+    "messages": ()
+})
+
+# Canned fetch_investigation_data results
+_MOCK_SUCCESS = {
+    "success": True,
+    "articles": _MOCK_ARTICLES,
+    "rss_articles": 1,
+    "api_articles": 1,
+    "total_articles": 2,
+    "dedup_stats": {"duplicates_removed": 0},
+    "source_breakdown": {"MockNews": 1, "MockAPI": 1},
+    "errors": []
+}
+
+_MOCK_FAIL = {
+    "success": False,
+    "articles": [],
+    "errors": ["Mock fetch error"],
+    "total_articles": 0
+}
+
+# Investigations written to PostgreSQL by the ArticleStore tests below
+_STORE_TEST_INVESTIGATIONS = ("test_inv_001", "test_stats_001")
+
+
+@pytest.fixture(autouse=True)
+def _reset_bus():
+    """Reset the MessageBus singleton after every test."""
+    yield
+    MessageBus.reset_singleton()
+
+
 @pytest.fixture
 def message_bus():
     """Create a MessageBus instance for testing."""
-    bus = MessageBus()
-    yield bus
-    # Reset singleton for clean tests
-    MessageBus.reset_singleton()
+    return MessageBus()
+
+
+@pytest.fixture(scope="module")
+def shared_article_store(pg_session_factory):
+    """Create an ArticleStore shared by tests with disjoint investigation IDs."""
+    return ArticleStore(session_factory=pg_session_factory)
+
+
+@pytest_asyncio.fixture
+async def article_store(pg_test_lock, shared_article_store):
+    """Hand out the shared store with the test investigations cleared."""
+    for investigation_id in _STORE_TEST_INVESTIGATIONS:
+        await shared_article_store.delete_investigation(investigation_id)
+    yield shared_article_store
+    for investigation_id in _STORE_TEST_INVESTIGATIONS:
+        await shared_article_store.delete_investigation(investigation_id)
 
 
 @pytest.fixture
-def article_store():
-    """Create an ArticleStore instance for testing."""
-    return ArticleStore()
+def mock_article_store():
+    """Create an ArticleStore stand-in that records save_articles calls."""
+    store = MagicMock(spec=ArticleStore)
+    store.save_articles = AsyncMock(
+        return_value={"saved": 2, "updated": 0, "duplicates": 0, "total": 2}
+    )
+    return store
 
 
 @pytest.fixture
@@ -43,35 +130,34 @@ def agent_registry():
 
 
 @pytest.fixture
-async def planning_agent(message_bus, agent_registry):
+def planning_agent(message_bus, agent_registry):
     """Create a PlanningOrchestrator with message bus."""
-    agent = PlanningOrchestrator(
+    return PlanningOrchestrator(
         registry=agent_registry,
         message_bus=message_bus,
         max_refinements=3
     )
-    return agent
 
 
 @pytest.fixture
-async def news_agent(message_bus, article_store):
+def news_agent(message_bus, mock_article_store):
     """Create a NewsFeedAgent with message bus and article store."""
-    agent = NewsFeedAgent(
+    return NewsFeedAgent(
         message_bus=message_bus,
-        article_store=article_store
+        article_store=mock_article_store
     )
-    return agent
+
+
+@pytest.fixture
+def wired_stack(planning_agent, news_agent):
+    """Pair a PlanningOrchestrator and NewsFeedAgent sharing one message bus."""
+    return planning_agent, news_agent
 
 
 @pytest.mark.asyncio
-async def test_crawler_message_subscription():
+async def test_crawler_message_subscription(wired_stack):
     """Test that NewsFeedAgent subscribes to message bus topics."""
-    message_bus = MessageBus()
-    article_store = ArticleStore()
-    news_agent = NewsFeedAgent(
-        message_bus=message_bus,
-        article_store=article_store
-    )
+    _, news_agent = wired_stack
 
     async with news_agent:
         # Verify subscriptions exist
@@ -81,129 +167,50 @@ async def test_crawler_message_subscription():
         assert any("investigation.start" in key for key in subscriber_keys)
         assert any("crawler.fetch" in key for key in subscriber_keys)
 
-    # Cleanup
-    MessageBus.reset_singleton()
-
 
 @pytest.mark.asyncio
-async def test_planning_agent_triggers_crawler():
+async def test_planning_agent_triggers_crawler(message_bus, planning_agent):
     """Test that Planning Agent triggers crawler execution for news-related tasks."""
-    # Create shared message bus
-    message_bus = MessageBus()
-
-    # Track published messages
-    published_messages = []
-    original_publish = message_bus.publish
+    # Tap investigation.start on the bus
+    captured = []
 
-    async def tracking_publish(key, message):
-        published_messages.append({"key": key, "message": message})
-        await original_publish(key, message)
+    async def tap(message):
+        captured.append(message)
 
-    message_bus.publish = tracking_publish
-
-    # Create planning agent
-    planning_agent = PlanningOrchestrator(
-        message_bus=message_bus,
-        max_refinements=3
+    message_bus.subscribe_to_pattern(
+        subscriber_name="test_tap",
+        pattern="investigation.start",
+        callback=tap
     )
 
-    # Create objective that should trigger news crawling
-    objective = "Investigate recent political developments in Ukraine"
-
-    # Build state with news-related subtasks
-    state = {
-        "objective": objective,
-        "subtasks": [
-            {
-                "id": "ST-001",
-                "description": "Find recent news articles about Ukraine",
-                "priority": 9,
-                "suggested_sources": ["news"],
-                "status": "pending"
-            }
-        ],
-        "messages": []
-    }
-
     # Trigger assignment (which should trigger crawler)
-    result = await planning_agent.assign_agents(state)
+    result = await planning_agent.assign_agents({**_NEWS_STATE, "messages": []})
 
     # Verify investigation.start was published
-    investigation_start_messages = [
-        msg for msg in published_messages
-        if msg["key"] == "investigation.start"
-    ]
-
-    assert len(investigation_start_messages) > 0, "No investigation.start message published"
+    await asyncio.wait_for(message_bus.drain(), timeout=2.0)
+    assert len(captured) > 0, "No investigation.start message published"
 
-    start_msg = investigation_start_messages[0]["message"]
+    start_msg = captured[0]["payload"]
     assert "investigation_id" in start_msg
     assert "query" in start_msg
     assert "objective" in start_msg
 
-    # Cleanup
-    MessageBus.reset_singleton()
-
 
 @pytest.mark.asyncio
-async def test_full_crawler_pipeline_with_mock():
+async def test_full_crawler_pipeline_with_mock(
+    message_bus, wired_stack, mock_article_store
+):
     """Test complete pipeline from Planning Agent to ArticleStore with mocked RSS/API."""
-    # Create shared infrastructure
-    message_bus = MessageBus()
-    article_store = ArticleStore()
-
-    # Create agents
-    planning_agent = PlanningOrchestrator(
-        message_bus=message_bus,
-        max_refinements=3
-    )
-
-    news_agent = NewsFeedAgent(
-        message_bus=message_bus,
-        article_store=article_store
-    )
-
-    # Mock RSS and API fetching to avoid external calls
-    mock_articles = [
-        {
-            "title": "Test Article 1",
-            "url": "https://example.com/article1",
-            "content": "Test content about Ukraine politics",
-            "published_date": datetime.now(timezone.utc).isoformat(),
-            "source": {"name": "MockNews", "type": "rss"},
-            "metadata": {"test": True}
-        },
-        {
-            "title": "Test Article 2",
-            "url": "https://example.com/article2",
-            "content": "More test content about Ukraine",
-            "published_date": datetime.now(timezone.utc).isoformat(),
-            "source": {"name": "MockAPI", "type": "api"},
-            "metadata": {"test": True}
-        }
-    ]
+    planning_agent, news_agent = wired_stack
 
     # Mock the fetch_investigation_data method
-    async def mock_fetch(*args, **kwargs):
-        return {
-            "success": True,
-            "articles": mock_articles,
-            "rss_articles": 1,
-            "api_articles": 1,
-            "total_articles": 2,
-            "dedup_stats": {"duplicates_removed": 0},
-            "source_breakdown": {"MockNews": 1, "MockAPI": 1},
-            "errors": []
-        }
+    news_agent.fetch_investigation_data = AsyncMock(return_value=_MOCK_SUCCESS)
 
-    news_agent.fetch_investigation_data = mock_fetch
-
-    # Track crawler completion messages
-    completion_messages = []
+    # Track crawler completion messages (the bus filters by pattern)
+    completions = asyncio.Queue()
 
     async def track_completion(message):
-        if message.get("key") == "crawler.complete":
-            completion_messages.append(message)
+        await completions.put(message)
 
     # Subscribe to completion messages
     message_bus.subscribe_to_pattern(
@@ -212,80 +219,59 @@ async def test_full_crawler_pipeline_with_mock():
         callback=track_completion
     )
 
+    # Capture the generated investigation ID from the start message
+    started_ids = []
+
+    async def track_start(message):
+        started_ids.append(message["payload"]["investigation_id"])
+
+    message_bus.subscribe_to_pattern(
+        subscriber_name="test_start_tap",
+        pattern="investigation.start",
+        callback=track_start
+    )
+
     # Initialize news agent (subscribes to topics)
     async with news_agent:
-        # Create investigation objective
-        objective = "Investigate recent political developments in Ukraine"
-
-        # Planning agent creates subtasks and triggers crawler
-        state = {
-            "objective": objective,
-            "subtasks": [
-                {
-                    "id": "ST-001",
-                    "description": "Find recent news articles about Ukraine",
-                    "priority": 9,
-                    "suggested_sources": ["news"],
-                    "status": "pending"
-                }
-            ],
-            "messages": []
-        }
-
-        # Trigger assignment (publishes investigation.start)
-        await planning_agent.assign_agents(state)
+        # Planning agent triggers crawler (publishes investigation.start)
+        await planning_agent.assign_agents({**_NEWS_STATE, "messages": []})
 
-        # Wait for async message handling
-        await asyncio.sleep(0.5)
+        # Drain covers the crawler's storage and its crawler.complete publish
+        await asyncio.wait_for(message_bus.drain(), timeout=2.0)
+        assert not completions.empty(), "No crawler.complete message received"
+        completion = completions.get_nowait()
 
-        # Verify articles were stored
-        investigation_id = list(article_store._storage.keys())[0]  # Get the generated ID
-        stored_data = await article_store.retrieve_by_investigation(investigation_id)
+        # Verify articles were handed to the store
+        assert started_ids, "No investigation.start message received"
+        investigation_id = started_ids[0]
+        mock_article_store.save_articles.assert_awaited_once()
+        save_kwargs = mock_article_store.save_articles.await_args.kwargs
 
-        assert stored_data["total_articles"] == 2, "Articles not stored correctly"
-        assert len(stored_data["articles"]) == 2
+        assert save_kwargs["investigation_id"] == investigation_id
+        assert len(save_kwargs["articles"]) == 2, "Articles not stored correctly"
 
         # Verify completion message was sent
-        await asyncio.sleep(0.2)  # Allow time for message propagation
-        assert len(completion_messages) > 0, "No crawler.complete message received"
-
-        completion_msg = completion_messages[0]["payload"]
+        completion_msg = completion["payload"]
         assert completion_msg["agent"] == "NewsFeedAgent"
         assert completion_msg["article_count"] == 2
 
-    # Cleanup
-    MessageBus.reset_singleton()
-
 
 @pytest.mark.asyncio
-async def test_crawler_failure_handling():
+async def test_crawler_failure_handling(message_bus, mock_article_store):
     """Test that crawler failures are properly reported via message bus."""
-    # Create shared infrastructure
-    message_bus = MessageBus()
-    article_store = ArticleStore()
-
     news_agent = NewsFeedAgent(
         message_bus=message_bus,
-        article_store=article_store
+        article_store=mock_article_store
     )
 
     # Mock fetch to fail
-    async def mock_fetch_fail(*args, **kwargs):
-        return {
-            "success": False,
-            "articles": [],
-            "errors": ["Mock fetch error"],
-            "total_articles": 0
-        }
-
-    news_agent.fetch_investigation_data = mock_fetch_fail
+    news_agent.fetch_investigation_data = AsyncMock(return_value=_MOCK_FAIL)
 
-    # Track failure messages
-    failure_messages = []
+    # Track failure messages (the bus filters by pattern)
+    failures = asyncio.Queue()
 
     async def track_failure(message):
-        if message.get("key") == "crawler.failed":
-            failure_messages.append(message)
+        await failures.put(message)
 
     message_bus.subscribe_to_pattern(
         subscriber_name="test_failure_tracker",
@@ -305,32 +291,27 @@ async def test_crawler_failure_handling():
             }
         )
 
-        # Wait for handling
-        await asyncio.sleep(0.5)
+        # Wait for handling and verify failure was reported
+        await asyncio.wait_for(message_bus.drain(), timeout=2.0)
+        assert not failures.empty(), "No crawler.failed message received"
+        failure = failures.get_nowait()
 
-        # Verify failure was reported
-        assert len(failure_messages) > 0, "No crawler.failed message received"
-
-        failure_msg = failure_messages[0]["payload"]
+        failure_msg = failure["payload"]
         assert failure_msg["agent"] == "NewsFeedAgent"
         assert failure_msg["investigation_id"] == "test_fail_001"
-
-    # Cleanup
-    MessageBus.reset_singleton()
+        mock_article_store.save_articles.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_article_storage_and_retrieval():
+async def test_article_storage_and_retrieval(article_store):
     """Test that articles are properly stored and can be retrieved."""
-    article_store = ArticleStore()
-
     # Create test articles
     test_articles = [
         {
             "title": "Test Article",
             "url": "https://example.com/test",
             "content": "Test content",
-            "published_date": datetime.now(timezone.utc).isoformat(),
+            "published_date": _FIXED_TS,
             "source": {"name": "TestSource"},
             "metadata": {}
         }
@@ -370,17 +351,15 @@ async def test_article_storage_and_retrieval():
 
 
 @pytest.mark.asyncio
-async def test_investigation_statistics():
+async def test_investigation_statistics(article_store):
     """Test that investigation statistics are properly tracked."""
-    article_store = ArticleStore()
-
     # Create articles from different sources
     articles = [
         {
             "title": f"Article {i}",
             "url": f"https://example.com/article{i}",
             "content": "Content",
-            "published_date": datetime.now(timezone.utc).isoformat(),
+            "published_date": _FIXED_TS,
             "source": {"name": "Source A" if i < 3 else "Source B"},
             "metadata": {}
         }
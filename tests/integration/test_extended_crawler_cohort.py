@@ -20,7 +20,10 @@ from osint_system.agents.crawlers.document_scraper_agent import DocumentCrawler
 from osint_system.agents.crawlers.web_crawler import HybridWebCrawler
 from osint_system.agents.crawlers.coordination.url_manager import URLManager
 from osint_system.agents.crawlers.coordination.authority_scorer import AuthorityScorer
-from osint_system.agents.crawlers.coordination.context_coordinator import ContextCoordinator
+from osint_system.agents.crawlers.coordination.context_coordinator import (
+    ContextCoordinator,
+    EntityDiscovery,
+)
 from osint_system.agents.communication.bus import MessageBus
 
 
@@ -140,6 +143,23 @@ class TestAuthorityScorer:
 
         assert enhanced_score > base_score
 
+    def test_batch_scores_match_single_scores(self, authority_scorer):
+        """Test that batched scoring agrees with per-URL scoring."""
+        urls = [
+            "https://www.reuters.com/a",
+            "https://reuters.com/b",
+            "https://state.gov/report.pdf",
+            "https://reddit.com/r/news/1",
+        ]
+        metadata = [None, {"author_verified": True}, None, None]
+
+        batch = authority_scorer.calculate_scores(urls, metadata)
+
+        assert batch == [
+            authority_scorer.calculate_score(url, meta)
+            for url, meta in zip(urls, metadata)
+        ]
+
     def test_domain_category_classification(self, authority_scorer):
         """Test domain categorization."""
         assert authority_scorer.get_domain_category("https://state.gov/report") == "official"
@@ -147,6 +167,13 @@ class TestAuthorityScorer:
         assert authority_scorer.get_domain_category("https://reddit.com/r/news") == "social"
         assert authority_scorer.get_domain_category("https://randomsite.com") == "unknown"
 
+    def test_domain_category_matches_whole_labels(self, authority_scorer):
+        """Test categories match label suffixes, not arbitrary substrings."""
+        assert authority_scorer.get_domain_category("https://www.gov.uk/guidance") == "official"
+        assert authority_scorer.get_domain_category("https://www.ox.ac.uk") == "academic"
+        assert authority_scorer.get_domain_category("https://fox.com/news") == "unknown"
+        assert authority_scorer.get_domain_category("https://gov.com") == "unknown"
+
 
 class TestContextCoordinator:
     """Tests for context sharing between crawlers."""
@@ -193,6 +220,58 @@ class TestContextCoordinator:
         assert "russia" in found
         assert "putin" in found
 
+    @pytest.mark.asyncio
+    async def test_cross_reference_automaton_matches_scan(
+        self, context_coordinator, monkeypatch
+    ):
+        """Test that the Aho-Corasick path agrees with the substring scan."""
+        pytest.importorskip("ahocorasick")
+        from osint_system.agents.crawlers.coordination import context_coordinator as module
+
+        def both_paths(content):
+            with_automaton = context_coordinator.cross_reference(content)
+            monkeypatch.setattr(module, "AHOCORASICK_AVAILABLE", False)
+            scanned = context_coordinator.cross_reference(content)
+            monkeypatch.setattr(module, "AHOCORASICK_AVAILABLE", True)
+            return with_automaton, scanned
+
+        def discovery(entity, investigation_id):
+            return EntityDiscovery(
+                entity=entity,
+                entity_type="organization",
+                source_url="https://reuters.com/a",
+                source_crawler="NewsFeedAgent",
+                investigation_id=investigation_id,
+                context="",
+            )
+
+        content = "NATO summit opens as NATO allies meet in Brussels"
+
+        # No entities yet: the automaton stays EMPTY and must not be searched
+        assert both_paths(content) == ([], [])
+
+        # Overlapping entities and a blank one (normalized to "")
+        await context_coordinator.share_discoveries([
+            discovery("NATO", "inv-a"),
+            discovery("NATO summit", "inv-a"),
+            discovery("Kremlin", "inv-a"),
+            discovery("  ", "inv-a"),
+        ])
+        automaton, scanned = both_paths(content)
+        assert automaton == scanned == ["nato", "nato summit", ""]
+
+        # New entities invalidate the cached automaton
+        await context_coordinator.share_discoveries([discovery("Brussels", "inv-b")])
+        automaton, scanned = both_paths(content)
+        assert automaton == scanned
+        assert "brussels" in automaton
+
+        # So does clearing an investigation
+        context_coordinator.clear_investigation("inv-b")
+        automaton, scanned = both_paths(content)
+        assert automaton == scanned
+        assert "brussels" not in automaton
+
     @pytest.mark.asyncio
     async def test_related_sources_retrieval(self, context_coordinator):
         """Test getting sources that mention an entity."""
@@ -271,11 +350,13 @@ class TestCrawlerCoordination:
         web_crawler.fetch = AsyncMock(return_value=mock_web_result)
 
         # Run crawlers in parallel
-        results = await asyncio.gather(
-            reddit_crawler.crawl_investigation(investigation_id, keywords),
-            doc_crawler.process_document("https://un.org/report.pdf"),
-            web_crawler.fetch("https://bbc.com/ukraine-news"),
-        )
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(reddit_crawler.crawl_investigation(investigation_id, keywords)),
+                tg.create_task(doc_crawler.process_document("https://un.org/report.pdf")),
+                tg.create_task(web_crawler.fetch("https://bbc.com/ukraine-news")),
+            ]
+        results = [task.result() for task in tasks]
 
         # Verify all results returned
         assert len(results) == 3
@@ -319,11 +400,12 @@ class TestCrawlerCoordination:
             {"url": "https://randomsite.xyz/article", "type": "unknown"},
         ]
 
-        # Score all sources
-        scored_sources = []
-        for source in sources:
-            score = authority_scorer.calculate_score(source["url"])
-            scored_sources.append({"url": source["url"], "score": score})
+        # Score all sources in one batch
+        urls = [source["url"] for source in sources]
+        scored_sources = [
+            {"url": url, "score": score}
+            for url, score in zip(urls, authority_scorer.calculate_scores(urls))
+        ]
 
         # Sort by score descending
         scored_sources.sort(key=lambda x: x["score"], reverse=True)
@@ -374,21 +456,19 @@ class TestCrawlerCoordination:
 class TestMessageBusIntegration:
     """Tests for message bus coordination between crawlers."""
 
-    @pytest.mark.asyncio
-    async def test_crawler_completion_messages(self, message_bus):
-        """Test that crawlers can publish completion messages."""
-        completion_messages = []
-
-        async def track_completion(msg):
-            if "crawler.complete" in msg.get("key", ""):
-                completion_messages.append(msg)
-
-        message_bus.subscribe_to_pattern(
-            subscriber_name="completion_tracker",
-            pattern="crawler.complete",
-            callback=track_completion,
+    @pytest.fixture
+    def bus_trackers(self, message_bus):
+        """Pre-register crawler.* and context.* trackers in one batch."""
+        queues = {"crawler": asyncio.Queue(), "context": asyncio.Queue()}
+        message_bus.subscribe_batch(
+            "bus_tracker",
+            [(f"{prefix}.*", queue.put) for prefix, queue in queues.items()],
         )
+        return queues
 
+    @pytest.mark.asyncio
+    async def test_crawler_completion_messages(self, message_bus, bus_trackers):
+        """Test that crawlers can publish completion messages."""
         # Simulate crawler publishing completion
         await message_bus.publish(
             "crawler.complete",
@@ -400,27 +480,16 @@ class TestMessageBusIntegration:
             },
         )
 
-        # Allow message propagation
-        await asyncio.sleep(0.1)
+        # Wait for message propagation
+        completion = await asyncio.wait_for(bus_trackers["crawler"].get(), timeout=1.0)
 
-        assert len(completion_messages) >= 1
-        assert completion_messages[0]["payload"]["agent"] == "RedditCrawler"
+        assert completion["key"] == "crawler.complete"
+        assert completion["payload"]["agent"] == "RedditCrawler"
+        assert bus_trackers["context"].empty()
 
     @pytest.mark.asyncio
-    async def test_context_update_broadcast(self, message_bus, context_coordinator):
+    async def test_context_update_broadcast(self, bus_trackers, context_coordinator):
         """Test that context updates are broadcast via message bus."""
-        context_updates = []
-
-        async def track_context(msg):
-            if "context.update" in msg.get("key", ""):
-                context_updates.append(msg)
-
-        message_bus.subscribe_to_pattern(
-            subscriber_name="context_tracker",
-            pattern="context.update",
-            callback=track_context,
-        )
-
         # Share a discovery (should broadcast)
         await context_coordinator.share_discovery(
             entity="Test Entity",
@@ -430,11 +499,41 @@ class TestMessageBusIntegration:
             investigation_id="broadcast_test",
         )
 
-        # Allow message propagation
-        await asyncio.sleep(0.1)
+        # Wait for message propagation
+        update = await asyncio.wait_for(bus_trackers["context"].get(), timeout=1.0)
+
+        assert update["key"] == "context.update"
+        assert update["payload"]["entity"] == "Test Entity"
+
+    def test_has_subscribers_matches_patterns(self, message_bus, bus_trackers):
+        """Test that has_subscribers reflects the registered patterns."""
+        assert message_bus.has_subscribers("crawler.complete")
+        assert message_bus.has_subscribers("context.update.batch")
+        assert not message_bus.has_subscribers("investigation.start")
+
+        message_bus.unsubscribe("bus_tracker")
+        assert not message_bus.has_subscribers("context.update")
+
+    @pytest.mark.asyncio
+    async def test_context_batch_broadcast(self, bus_trackers, context_coordinator):
+        """Test that a batch of discoveries is broadcast as one message."""
+        await context_coordinator.share_discoveries([
+            EntityDiscovery(
+                entity=entity,
+                entity_type="person",
+                source_url="https://example.com/article",
+                source_crawler="TestCrawler",
+                investigation_id="batch_test",
+                context="",
+            )
+            for entity in ("Alice", "Bob")
+        ])
+
+        update = await asyncio.wait_for(bus_trackers["context"].get(), timeout=1.0)
 
-        assert len(context_updates) >= 1
-        assert context_updates[0]["payload"]["entity"] == "Test Entity"
+        assert update["key"] == "context.update.batch"
+        assert [d["entity"] for d in update["payload"]["discoveries"]] == ["Alice", "Bob"]
+        assert bus_trackers["context"].empty()
 
 
 class TestInvestigationWorkflow:
@@ -461,20 +560,24 @@ class TestInvestigationWorkflow:
 
         # Simulate discoveries from each crawler
 
-        # 1. Reddit finds discussion posts
+        # 1. Reddit finds discussion posts, shared as one batch
         reddit_urls = [
             "https://reddit.com/r/worldnews/post1",
             "https://reddit.com/r/geopolitics/post2",
         ]
         for url in reddit_urls:
             url_manager.add_url(url, investigation_id)
-            await context_coordinator.share_discovery(
+        await context_coordinator.share_discoveries([
+            EntityDiscovery(
                 entity="Ukraine",
                 entity_type="location",
                 source_url=url,
                 source_crawler="RedditCrawler",
                 investigation_id=investigation_id,
+                context="",
             )
+            for url in reddit_urls
+        ])
 
         # 2. Document crawler finds UN report
         doc_url = "https://un.org/ukraine-report.pdf"
@@ -504,6 +607,7 @@ class TestInvestigationWorkflow:
         # Verify entity tracking
         entities = context_coordinator.get_investigation_entities(investigation_id)
         assert "ukraine" in entities
+        assert context_coordinator.get_related_sources("Ukraine") == reddit_urls
         assert "united nations" in entities
 
         # Verify authority scoring
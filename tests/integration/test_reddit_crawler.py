@@ -13,119 +13,165 @@ Mocks asyncpraw.Reddit when credentials not available.
 
 import asyncio
 import pytest
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timezone
+
+# Skip the whole module cleanly when the Reddit client library is missing
+pytest.importorskip("asyncpraw")
 
 from osint_system.agents.crawlers.social_media_agent import RedditCrawler
 from osint_system.agents.communication.bus import MessageBus
 from osint_system.config.settings import settings
 
 
+# Live-API tests only run when Reddit credentials are configured
+_HAS_REDDIT_CREDS = bool(settings.reddit_client_id and settings.reddit_client_secret)
+
+# Read-only reddit.crawl messages; handle_crawl_request only reads them
+_MSG_NO_INVESTIGATION = MappingProxyType({
+    "id": "msg-123",
+    "payload": MappingProxyType({"keywords": ("test",)}),
+})
+_MSG_NO_KEYWORDS = MappingProxyType({
+    "id": "msg-123",
+    "payload": MappingProxyType({"investigation_id": "inv-123"}),
+})
+_MSG_CRAWL_ERROR = MappingProxyType({
+    "id": "msg-error",
+    "payload": MappingProxyType({"investigation_id": "inv-error", "keywords": ("test",)}),
+})
+
+# Fixed post timestamp so the module-scoped submissions are deterministic
+_CREATED_UTC = 1_700_000_000.0
+
+
+@pytest.fixture(autouse=True)
+def _reset_bus():
+    """Reset the MessageBus singleton after every test, even on failure."""
+    yield
+    MessageBus.reset_singleton()
+
+
 @pytest.fixture
 def message_bus():
     """Create a MessageBus instance for testing."""
-    bus = MessageBus()
-    yield bus
-    # Reset singleton for clean tests
-    MessageBus.reset_singleton()
+    return MessageBus()
 
 
-@pytest.fixture
+@pytest.fixture(scope="class")
+def crawler():
+    """Default RedditCrawler shared by a class's read-only tests (do not mutate)."""
+    return RedditCrawler()
+
+
+def _make_submission(**overrides) -> SimpleNamespace:
+    """
+    Build a lightweight stand-in for an asyncpraw submission.
+
+    Plain attributes replace MagicMock ones; only load() (awaited) and
+    comments (called and sliced by the crawler) stay mocks. author and
+    subreddit are plain strings since the crawler only calls str() on them.
+
+    Args:
+        **overrides: Attribute values replacing the defaults
+
+    Returns:
+        SimpleNamespace with the attributes RedditCrawler reads
+    """
+    comments = MagicMock()
+    comments.__getitem__.return_value = []
+    fields = {
+        "id": "abc123",
+        "title": "Test Post Title",
+        "selftext": "Test post content",
+        "url": "https://reddit.com/r/news/comments/abc123",
+        "score": 150,  # Above high-value threshold
+        "upvote_ratio": 0.92,
+        "author": "test_user",
+        "created_utc": _CREATED_UTC,
+        "num_comments": 50,  # Above min threshold
+        "subreddit": "news",
+        "permalink": "/r/news/comments/abc123/test_post",
+        "is_self": True,
+        "link_flair_text": "News",
+        "distinguished": None,
+        "stickied": False,
+        "locked": False,
+        "over_18": False,
+        "load": AsyncMock(),
+        "comments": comments,
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _make_subreddit(submissions) -> SimpleNamespace:
+    """
+    Build a stand-in subreddit whose search() yields the given submissions.
+
+    Args:
+        submissions: Submissions to yield, in order, from every search
+
+    Returns:
+        SimpleNamespace with an async-generator search method
+    """
+    async def search(*args, **kwargs):
+        for submission in submissions:
+            yield submission
+
+    return SimpleNamespace(search=search)
+
+
+@pytest.fixture(scope="module")
 def mock_submission():
     """Create a mock Reddit submission for testing."""
-    submission = MagicMock()
-    submission.id = "abc123"
-    submission.title = "Test Post Title"
-    submission.selftext = "Test post content"
-    submission.url = "https://reddit.com/r/news/comments/abc123"
-    submission.score = 150  # Above high-value threshold
-    submission.upvote_ratio = 0.92
-    submission.author = MagicMock()
-    submission.author.__str__ = lambda self: "test_user"
-    submission.created_utc = datetime.now(timezone.utc).timestamp()
-    submission.num_comments = 50  # Above min threshold
-    submission.subreddit = MagicMock()
-    submission.subreddit.__str__ = lambda self: "news"
-    submission.permalink = "/r/news/comments/abc123/test_post"
-    submission.is_self = True
-    submission.link_flair_text = "News"
-    submission.distinguished = None
-    submission.stickied = False
-    submission.locked = False
-    submission.over_18 = False
-    submission.load = AsyncMock()
-    submission.comments = MagicMock()
-    submission.comments.replace_more = MagicMock()
-    submission.comments.__getitem__ = MagicMock(return_value=[])
-    return submission
+    return _make_submission()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_low_score_submission():
     """Create a mock submission that should be filtered out."""
-    submission = MagicMock()
-    submission.id = "low123"
-    submission.title = "Low Score Post"
-    submission.selftext = "Low quality content"
-    submission.url = "https://reddit.com/r/news/comments/low123"
-    submission.score = 5  # Below MIN_SCORE_THRESHOLD (10)
-    submission.upvote_ratio = 0.60
-    submission.author = MagicMock()
-    submission.author.__str__ = lambda self: "low_user"
-    submission.created_utc = datetime.now(timezone.utc).timestamp()
-    submission.num_comments = 2  # Below MIN_COMMENTS_THRESHOLD (5)
-    submission.subreddit = MagicMock()
-    submission.subreddit.__str__ = lambda self: "news"
-    submission.permalink = "/r/news/comments/low123/low_post"
-    submission.is_self = True
-    submission.link_flair_text = None
-    submission.distinguished = None
-    submission.stickied = False
-    submission.locked = False
-    submission.over_18 = False
-    submission.load = AsyncMock()
-    return submission
-
-
-@pytest.fixture
+    return _make_submission(
+        id="low123",
+        title="Low Score Post",
+        selftext="Low quality content",
+        url="https://reddit.com/r/news/comments/low123",
+        score=5,  # Below MIN_SCORE_THRESHOLD (10)
+        upvote_ratio=0.60,
+        author="low_user",
+        num_comments=2,  # Below MIN_COMMENTS_THRESHOLD (5)
+        permalink="/r/news/comments/low123/low_post",
+        link_flair_text=None,
+    )
+
+
+@pytest.fixture(scope="module")
 def mock_deleted_author_submission():
     """Create a mock submission with deleted author."""
-    submission = MagicMock()
-    submission.id = "del123"
-    submission.title = "Deleted Author Post"
-    submission.selftext = "Author was deleted"
-    submission.url = "https://reddit.com/r/news/comments/del123"
-    submission.score = 100
-    submission.upvote_ratio = 0.90
-    submission.author = None  # Deleted author
-    submission.created_utc = datetime.now(timezone.utc).timestamp()
-    submission.num_comments = 20
-    submission.subreddit = MagicMock()
-    submission.subreddit.__str__ = lambda self: "news"
-    submission.permalink = "/r/news/comments/del123/deleted_post"
-    submission.is_self = True
-    submission.link_flair_text = None
-    submission.distinguished = None
-    submission.stickied = False
-    submission.locked = False
-    submission.over_18 = False
-    submission.load = AsyncMock()
-    return submission
+    return _make_submission(
+        id="del123",
+        title="Deleted Author Post",
+        selftext="Author was deleted",
+        url="https://reddit.com/r/news/comments/del123",
+        score=100,
+        upvote_ratio=0.90,
+        author=None,  # Deleted author
+        num_comments=20,
+        permalink="/r/news/comments/del123/deleted_post",
+        link_flair_text=None,
+    )
 
 
 class TestRedditCrawlerInitialization:
     """Test RedditCrawler initialization."""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, crawler):
         """Test initialization with default parameters."""
-        crawler = RedditCrawler()
         assert crawler.name == "RedditCrawler"
         assert crawler.max_requests_per_second == 1.0
         assert crawler.reddit_client is None
         assert crawler.message_bus is not None
         assert crawler._message_subscribed is False
-        # Reset message bus singleton
-        MessageBus.reset_singleton()
 
     def test_init_with_custom_params(self, message_bus):
         """Test initialization with custom parameters."""
@@ -150,42 +196,18 @@ class TestRedditCrawlerInitialization:
 class TestAuthorityFiltering:
     """Test authority filtering logic."""
 
-    def test_is_valid_author_with_valid_author(self):
-        """Test that valid authors pass validation."""
-        crawler = RedditCrawler()
-
-        # Mock a valid author
-        valid_author = MagicMock()
-        valid_author.__str__ = lambda self: "valid_user"
-
-        assert crawler._is_valid_author(valid_author) is True
-        MessageBus.reset_singleton()
-
-    def test_is_valid_author_with_none(self):
-        """Test that None author fails validation."""
-        crawler = RedditCrawler()
-        assert crawler._is_valid_author(None) is False
-        MessageBus.reset_singleton()
-
-    def test_is_valid_author_with_deleted(self):
-        """Test that [deleted] author fails validation."""
-        crawler = RedditCrawler()
-
-        deleted_author = MagicMock()
-        deleted_author.__str__ = lambda self: "[deleted]"
-
-        assert crawler._is_valid_author(deleted_author) is False
-        MessageBus.reset_singleton()
-
-    def test_is_valid_author_with_removed(self):
-        """Test that [removed] author fails validation."""
-        crawler = RedditCrawler()
-
-        removed_author = MagicMock()
-        removed_author.__str__ = lambda self: "[removed]"
-
-        assert crawler._is_valid_author(removed_author) is False
-        MessageBus.reset_singleton()
+    @pytest.mark.parametrize(
+        "author,expected",
+        [
+            ("valid_user", True),
+            (None, False),
+            ("[deleted]", False),
+            ("[removed]", False),
+        ],
+    )
+    def test_is_valid_author(self, crawler, author, expected):
+        """Test that deleted, removed and missing authors fail validation."""
+        assert crawler._is_valid_author(author) is expected
 
 
 class TestMessageBusIntegration:
@@ -224,36 +246,17 @@ class TestMessageBusIntegration:
             assert crawler._message_subscribed is False
 
     @pytest.mark.asyncio
-    async def test_handle_crawl_request_missing_investigation_id(self, message_bus):
-        """Test that crawl request without investigation_id is rejected."""
-        crawler = RedditCrawler(message_bus=message_bus)
-
-        message = {
-            "id": "msg-123",
-            "payload": {
-                "keywords": ["test"],
-            }
-        }
-
-        # Should not raise, just log warning
-        await crawler.handle_crawl_request(message)
-        MessageBus.reset_singleton()
-
-    @pytest.mark.asyncio
-    async def test_handle_crawl_request_missing_keywords(self, message_bus):
-        """Test that crawl request without keywords is rejected."""
+    @pytest.mark.parametrize(
+        "message",
+        [_MSG_NO_INVESTIGATION, _MSG_NO_KEYWORDS],
+        ids=["missing_investigation_id", "missing_keywords"],
+    )
+    async def test_handle_crawl_request_rejects_incomplete(self, message_bus, message):
+        """Test that crawl requests missing required fields are rejected."""
         crawler = RedditCrawler(message_bus=message_bus)
 
-        message = {
-            "id": "msg-123",
-            "payload": {
-                "investigation_id": "inv-123",
-            }
-        }
-
         # Should not raise, just log warning
         await crawler.handle_crawl_request(message)
-        MessageBus.reset_singleton()
 
 
 class TestCrawlInvestigation:
@@ -266,14 +269,8 @@ class TestCrawlInvestigation:
         """Test that low-score posts are filtered out."""
         crawler = RedditCrawler(message_bus=message_bus)
 
-        # Create mock subreddit that yields both submissions
-        mock_subreddit = MagicMock()
-
-        async def mock_search(*args, **kwargs):
-            yield mock_low_score_submission  # Should be filtered (score=5)
-            yield mock_submission  # Should pass (score=150)
-
-        mock_subreddit.search = mock_search
+        # Low-score post (score=5) should be filtered, high-score (150) pass
+        mock_subreddit = _make_subreddit([mock_low_score_submission, mock_submission])
 
         # Mock Reddit client
         mock_reddit = MagicMock()
@@ -291,7 +288,6 @@ class TestCrawlInvestigation:
         assert len(result["posts"]) == 1
         assert result["posts"][0]["id"] == "abc123"
         assert result["metadata"]["total_filtered"] > 0
-        MessageBus.reset_singleton()
 
     @pytest.mark.asyncio
     async def test_crawl_investigation_filters_deleted_author(
@@ -300,13 +296,8 @@ class TestCrawlInvestigation:
         """Test that posts with deleted authors are filtered out."""
         crawler = RedditCrawler(message_bus=message_bus)
 
-        mock_subreddit = MagicMock()
-
-        async def mock_search(*args, **kwargs):
-            yield mock_deleted_author_submission  # Should be filtered (no author)
-            yield mock_submission  # Should pass
-
-        mock_subreddit.search = mock_search
+        # Deleted-author post should be filtered, the valid one pass
+        mock_subreddit = _make_subreddit([mock_deleted_author_submission, mock_submission])
 
         mock_reddit = MagicMock()
         mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
@@ -322,7 +313,6 @@ class TestCrawlInvestigation:
         # Only the valid post should be included
         assert len(result["posts"]) == 1
         assert result["posts"][0]["id"] == "abc123"
-        MessageBus.reset_singleton()
 
     @pytest.mark.asyncio
     async def test_crawl_investigation_returns_metadata(
@@ -331,12 +321,7 @@ class TestCrawlInvestigation:
         """Test that crawl_investigation returns proper metadata."""
         crawler = RedditCrawler(message_bus=message_bus)
 
-        mock_subreddit = MagicMock()
-
-        async def mock_search(*args, **kwargs):
-            yield mock_submission
-
-        mock_subreddit.search = mock_search
+        mock_subreddit = _make_subreddit([mock_submission])
 
         mock_reddit = MagicMock()
         mock_reddit.subreddit = AsyncMock(return_value=mock_subreddit)
@@ -354,7 +339,6 @@ class TestCrawlInvestigation:
         assert "metadata" in result
         assert result["metadata"]["keywords"] == ["Syria", "conflict"]
         assert "crawled_at" in result["metadata"]
-        MessageBus.reset_singleton()
 
 
 class TestErrorHandling:
@@ -368,12 +352,7 @@ class TestErrorHandling:
         async def mock_subreddit_raises(name):
             if name == "news":
                 raise Exception("Subreddit unavailable")
-            mock_sub = MagicMock()
-            async def empty_search(*args, **kwargs):
-                return
-                yield  # Make it an async generator that yields nothing
-            mock_sub.search = empty_search
-            return mock_sub
+            return _make_subreddit([])
 
         mock_reddit = MagicMock()
         mock_reddit.subreddit = mock_subreddit_raises
@@ -390,7 +369,6 @@ class TestErrorHandling:
         # Should complete with partial results
         assert result["investigation_id"] == "test-error"
         assert "worldnews" in result["metadata"]["subreddits_searched"]
-        MessageBus.reset_singleton()
 
     @pytest.mark.asyncio
     async def test_message_bus_publishes_on_error(self, message_bus):
@@ -411,30 +389,20 @@ class TestErrorHandling:
         with patch.object(crawler, 'crawl_investigation', new_callable=AsyncMock) as mock_crawl:
             mock_crawl.side_effect = Exception("API Error")
 
-            message = {
-                "id": "msg-error",
-                "payload": {
-                    "investigation_id": "inv-error",
-                    "keywords": ["test"],
-                }
-            }
-
-            await crawler.handle_crawl_request(message)
+            await crawler.handle_crawl_request(_MSG_CRAWL_ERROR)
 
         # Verify reddit.failed was published
         failed_msgs = [m for m in published_messages if m["key"] == "reddit.failed"]
         assert len(failed_msgs) == 1
         assert failed_msgs[0]["message"]["investigation_id"] == "inv-error"
         assert "API Error" in failed_msgs[0]["message"]["error"]
-        MessageBus.reset_singleton()
 
 
 class TestCapabilities:
     """Test capability reporting."""
 
-    def test_get_capabilities(self):
+    def test_get_capabilities(self, crawler):
         """Test that get_capabilities returns expected capabilities."""
-        crawler = RedditCrawler()
         capabilities = crawler.get_capabilities()
 
         expected_capabilities = [
@@ -449,12 +417,10 @@ class TestCapabilities:
         for cap in expected_capabilities:
             assert cap in capabilities
 
-        MessageBus.reset_singleton()
-
 
 # Skip tests that require real Reddit API credentials
 @pytest.mark.skipif(
-    not settings.reddit_client_id or not settings.reddit_client_secret,
+    not _HAS_REDDIT_CREDS,
     reason="Reddit API credentials not configured"
 )
 class TestRealRedditAPI:
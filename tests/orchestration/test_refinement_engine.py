@@ -0,0 +1,71 @@
+"""Tests for RefinementEngine reflection, follow-up questions and subtasks."""
+
+import re
+
+import pytest
+
+from osint_system.orchestration.refinement.iterative import RefinementEngine
+
+
+# Keys every generated subtask must carry
+_SUBTASK_KEYS = frozenset({"id", "description", "priority"})
+
+# Keys every reflection must carry
+_REFLECTION_KEYS = frozenset({"gaps", "patterns", "unexplored_angles", "reasoning"})
+
+# Gap wording that signals limited source diversity
+_SOURCE_GAP_RE = re.compile(r"source|insufficient", re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Create one RefinementEngine shared by the stateless engine checks."""
+    return RefinementEngine()
+
+
+class TestRefinementEngine:
+    """Test suite for the RefinementEngine."""
+
+    def test_reflection_on_findings(self, engine):
+        """Test reflection mechanism identifies gaps and patterns."""
+        findings = [
+            {"source": "news", "content": "Event at location", "confidence": 0.8},
+            {"source": "social", "content": "Witness reports", "confidence": 0.5},
+        ]
+
+        reflection = engine.reflect_on_findings(findings, "Investigate event")
+
+        assert _REFLECTION_KEYS <= reflection.keys()
+
+        # Should identify limited source diversity
+        assert any(_SOURCE_GAP_RE.search(gap) for gap in reflection["gaps"])
+
+    def test_follow_up_question_generation(self, engine):
+        """Test follow-up question generation based on gaps."""
+        gaps = ["Limited source diversity", "Low confidence evidence"]
+        patterns = ["Multiple sources agree on location"]
+
+        questions = engine._generate_follow_up_questions(
+            gaps, patterns, "Investigate event"
+        )
+
+        assert len(questions) > 0
+        assert any("source" in q.lower() for q in questions)
+        assert any("verify" in q.lower() for q in questions)
+
+    def test_targeted_subtask_creation(self, engine):
+        """Test creation of targeted subtasks from questions."""
+        questions = [
+            "Can we verify through official sources?",
+            "What do alternative sources reveal?"
+        ]
+        angles = ["Timeline analysis needed"]
+
+        subtasks = engine._create_targeted_subtasks(questions, angles, iteration=2)
+
+        assert len(subtasks) > 0
+        assert all(_SUBTASK_KEYS <= task.keys() for task in subtasks)
+
+        # Check ID format
+        assert any(task["id"].startswith("REF-02") for task in subtasks)
+        assert any(task["id"].startswith("ANG-02") for task in subtasks)
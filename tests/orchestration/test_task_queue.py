@@ -87,6 +87,19 @@ class TestTaskQueue:
         assert task.priority == 0.9
         assert task.status == "assigned"
 
+    def test_get_next_task_skips_unmatched_capability(self):
+        """Test that tasks needing another capability stay queued."""
+        queue = TaskQueue()
+        queue.add_task("Needs reddit", priority=0.9, metadata={"required_capability": "reddit"})
+        queue.add_task("Any agent", priority=0.5)
+
+        task = queue.get_next_task(agent_capabilities=["news"])
+        assert task.objective == "Any agent"
+        assert queue.get_next_task(agent_capabilities=["news"]) is None
+
+        task = queue.get_next_task(agent_capabilities=["reddit"])
+        assert task.objective == "Needs reddit"
+
     def test_update_task_status(self):
         """Test updating task status."""
         queue = TaskQueue()
@@ -161,6 +174,15 @@ class TestTaskQueue:
         # Should be sorted by priority (descending)
         assert pending[0].priority >= pending[1].priority
 
+    def test_get_pending_tasks_limit_returns_top_tasks(self):
+        """Test that a limit returns the highest priority tasks in order."""
+        queue = TaskQueue()
+        for i, priority in enumerate([0.2, 0.9, 0.5, 0.9, 0.7]):
+            queue.add_task(f"Task {i}", priority=priority)
+
+        top = queue.get_pending_tasks(limit=3)
+        assert [t.objective for t in top] == ["Task 1", "Task 3", "Task 4"]
+
     def test_queue_statistics(self):
         """Test queue statistics reporting."""
         queue = TaskQueue()
@@ -178,6 +200,21 @@ class TestTaskQueue:
         assert stats["completed_tasks"] == 1
         assert stats["investigation_keywords"] == 2
 
+    def test_queue_statistics_track_replacement_and_clear(self):
+        """Test that status counts follow reused task IDs and clear()."""
+        queue = TaskQueue()
+        queue.add_task("Task 1", priority=0.5, task_id="TASK-1")
+        queue.update_task_status("TASK-1", "failed")
+        queue.add_task("Task 1 retry", priority=0.5, task_id="TASK-1")
+
+        stats = queue.get_statistics()
+        assert stats["total_tasks"] == 1
+        assert stats["pending_tasks"] == 1
+        assert stats["failed_tasks"] == 0
+
+        queue.clear()
+        assert queue.get_statistics()["pending_tasks"] == 0
+
 
 class TestSignalAnalysis:
     """Test signal strength calculation."""
@@ -325,6 +362,25 @@ class TestCoverageMetrics:
         temporal = metrics.get_temporal_coverage()
         assert temporal > 0.6 and temporal < 0.7
 
+    def test_batch_update_matches_per_finding_updates(self):
+        """Test that update_from_findings equals repeated update_from_finding."""
+        now = datetime.utcnow()
+        findings = [
+            {"source": "a", "timestamp": now.isoformat(), "metadata": {"locations": ["UK"]}},
+            {"source": "b", "timestamp": "not a date", "metadata": {"topics": ["trade"]}},
+            {"source": "a", "timestamp": (now - timedelta(days=10)).isoformat()},
+        ]
+
+        single = CoverageMetrics()
+        for finding in findings:
+            single.update_from_finding(finding)
+        batch = CoverageMetrics()
+        batch.update_from_findings(findings)
+
+        assert batch.get_overall_coverage() == single.get_overall_coverage()
+        assert batch.earliest_timestamp == now - timedelta(days=10)
+        assert batch.latest_timestamp == now
+
     def test_topic_completeness_tracking(self):
         """Test topic completeness metric updates."""
         metrics = CoverageMetrics(expected_subtopics={"breach", "response", "impact", "attribution"})
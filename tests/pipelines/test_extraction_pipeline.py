@@ -82,9 +82,9 @@ def mock_fact_store():
     return store
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_article():
-    """Create a sample article in ArticleStore format."""
+    """Create a sample article in ArticleStore format (shared; do not mutate)."""
     return {
         "url": "https://example.com/article-1",
         "title": "Test Article Title",
@@ -103,9 +103,9 @@ def sample_article():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_articles(sample_article):
-    """Create multiple sample articles."""
+    """Create multiple sample articles (shared; do not mutate)."""
     articles = [sample_article]
     for i in range(2, 6):
         articles.append({
@@ -230,24 +230,21 @@ class TestListInvestigations:
 class TestContentHash:
     """Tests for content hashing behavior."""
 
-    @pytest.mark.asyncio
-    async def test_content_hash_deterministic(
-        self, store: ReportStore
-    ) -> None:
+    # _compute_hash is a staticmethod: no store (and no database session
+    # factory) is needed, so these stay independent of test ordering.
+
+    def test_content_hash_deterministic(self) -> None:
         """Same content always produces the same hash."""
         content = "Identical content for hashing test"
-        hash_1 = store._compute_hash(content)
-        hash_2 = store._compute_hash(content)
+        hash_1 = ReportStore._compute_hash(content)
+        hash_2 = ReportStore._compute_hash(content)
         assert hash_1 == hash_2
         assert len(hash_1) == 64  # SHA256 hex digest
 
-    @pytest.mark.asyncio
-    async def test_content_hash_differs_for_different_content(
-        self, store: ReportStore
-    ) -> None:
+    def test_content_hash_differs_for_different_content(self) -> None:
         """Different content produces different hashes."""
-        hash_1 = store._compute_hash("Content A")
-        hash_2 = store._compute_hash("Content B")
+        hash_1 = ReportStore._compute_hash("Content A")
+        hash_2 = ReportStore._compute_hash("Content B")
         assert hash_1 != hash_2
 
 